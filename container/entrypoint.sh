@@ -7,5 +7,7 @@ if [ "$RUN_MIGRATIONS" == "true" ]; then
     edaparts-migrate-upgrade
 fi
 
-APP_LOCATION="$(python -c 'import site; print(site.getsitepackages()[0])')/edaparts/app/main.py"
-exec fastapi run "$APP_LOCATION" --port "$APP_PORT" --workers "$APP_WORKERS"
+# uvloop and httptools are pinned explicitly, uvicorn silently falls back to
+# the pure python loop and parser if they cannot be loaded
+exec uvicorn edaparts.app.main:app --host 0.0.0.0 --port "$APP_PORT" \
+    --workers "$APP_WORKERS" --loop uvloop --http httptools
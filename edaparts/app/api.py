@@ -28,13 +28,29 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from starlette.applications import Request
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
 from edaparts.app.config import config
 from edaparts.services.database import sessionmanager
 from edaparts.services.exceptions import ApiError
 
 
+class ApiGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves the model file downloads, the footprints and
+    symbols /{model_id}/data endpoints, as they are. They keep their
+    Content-Length and aren't compressed chunk by chunk in the event loop.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/data"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 def exception_handler_api_error(_: Request, exc: Exception) -> JSONResponse:
     api_err = typing.cast(ApiError, exc)
     data, err_code = api_err.format_api_data()
@@ -42,14 +58,33 @@ def exception_handler_api_error(_: Request, exc: Exception) -> JSONResponse:
 
 
 def init_app():
-    sessionmanager.init(config.DB_CONNECTION_STRING, echo=config.DB_ECHO)
+    sessionmanager.init(
+        config.DB_CONNECTION_STRING,
+        echo=config.DB_ECHO,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        disable_pool=config.DB_DISABLE_POOL,
+        prepare_threshold=config.DB_PREPARE_THRESHOLD,
+    )
 
     @asynccontextmanager
-    async def lifespan(_: FastAPI):
+    async def lifespan(app: FastAPI):
         # Remove the existing locks
         if os.path.exists(config.LOCKS_DIR):
             shutil.rmtree(config.LOCKS_DIR)
 
+        if config.DB_POOL_WARMUP and not config.DB_DISABLE_POOL:
+            await sessionmanager.warm_up(
+                min(config.DB_POOL_WARMUP, config.DB_POOL_SIZE)
+            )
+
+        # Build the OpenAPI schema now, it's cached by FastAPI once generated
+        # and the first request to the docs doesn't have to pay for it
+        app.openapi()
+
         yield
         if sessionmanager._engine is not None:
             await sessionmanager.close()
@@ -60,4 +95,6 @@ def init_app():
 
     api.include_router(edaparts.routers.routers.router)
     api.add_exception_handler(ApiError, exception_handler_api_error)
+    # Listings compress several times over. Small bodies are sent as they are
+    api.add_middleware(ApiGZipMiddleware, minimum_size=1024, compresslevel=5)
     return api
@@ -37,11 +37,41 @@ class Config:
         ),
     )
     DB_ECHO = os.getenv("DB_ECHO", "False").lower() in ("true", "1", "t")
+    # Connection pool. Size it for the requests a worker can have waiting on
+    # the database, keeping the workers total below the server max_connections
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() in (
+        "true",
+        "1",
+        "t",
+    )
+    # Connections opened at startup, so the first requests don't pay for them
+    DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "0"))
+    # Executions of the same query in a connection after which psycopg prepares
+    # it server side. "none" disables them, needed behind PgBouncer transaction
+    # pooling
+    DB_PREPARE_THRESHOLD = (
+        None
+        if os.getenv("DB_PREPARE_THRESHOLD", "1").lower() == "none"
+        else int(os.getenv("DB_PREPARE_THRESHOLD", "1"))
+    )
+    # Open a connection per session instead of pooling them, for tests
+    DB_DISABLE_POOL = os.getenv("DB_DISABLE_POOL", "False").lower() in (
+        "true",
+        "1",
+        "t",
+    )
 
     MODELS_BASE_DIR = os.getenv("MODELS_BASE_DIR", "/var/lib/edaparts/library")
     LOCKS_DIR = os.getenv(
         "LOCKS_DIR", str(pathlib.Path(MODELS_BASE_DIR).parent.joinpath("locks"))
     )
+    # Internal location of a reverse proxy that serves MODELS_BASE_DIR. If set,
+    # model files are handed to the proxy with X-Accel-Redirect
+    MODELS_ACCEL_REDIRECT_PREFIX = os.getenv("MODELS_ACCEL_REDIRECT_PREFIX")
 
 
 config = Config
@@ -21,6 +21,7 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 #
+import functools
 import typing
 
 from pydantic import BaseModel, Field
@@ -45,6 +46,15 @@ class ComponentCreateRequestDto(BaseModel):
     )
 
 
+class ComponentsBatchCreateRequestDto(BaseModel):
+    # Bounded to keep the batch statements below the parameters limit of the DB
+    components: list[
+        Annotated[
+            ComponentCreateRequestDtoUnionAlias, Field(discriminator="component_type")
+        ]
+    ] = Field(..., min_length=1, max_length=500)
+
+
 class ComponentUpdateRequestDto(BaseModel):
     component: ComponentUpdateRequestDtoUnionAlias = Field(
         ..., discriminator="component_type"
@@ -61,19 +71,29 @@ _model_to_query_dto = {
 }
 
 
-def map_component_model_to_query_dto(
-    model: ComponentModelType,
-) -> ComponentSpecificQueryDto:
-    dto_t = _model_to_query_dto[type(model)]
-    dto_data = {
-        c.key: getattr(model, c.key)
-        for c in inspect(model).mapper.column_attrs
+@functools.cache
+def _query_dto_mapping(model_type: type) -> tuple[type, tuple[str, ...], str]:
+    # Resolved once per model type, as the mapper columns and the DTO
+    # fields never change at runtime
+    dto_t = _model_to_query_dto[model_type]
+    keys = tuple(
+        c.key
+        for c in inspect(model_type).column_attrs
         if c.key in dto_t.model_fields
-    }
-    # Fill the component type based on the pydantic discriminator
-    dto_data["component_type"] = typing.get_args(
+    )
+    # The component type based on the pydantic discriminator
+    component_type = typing.get_args(
         dto_t.model_fields["component_type"].annotation
     )[0]
+    return dto_t, keys, component_type
+
+
+def map_component_model_to_query_dto(
+    model: ComponentModelType,
+) -> ComponentSpecificQueryDto:
+    dto_t, keys, component_type = _query_dto_mapping(type(model))
+    dto_data = {key: getattr(model, key) for key in keys}
+    dto_data["component_type"] = component_type
     mapped_dto = dto_t(**dto_data)
     mapped_dto.fill_dto(model)
     return mapped_dto
@@ -85,3 +105,5 @@ class ComponentsListResultDto(BaseModel):
     page_number: int
     total_elements: int
     elements: list[ComponentSpecificQueryDto]
+    # Cursor to fetch the next page with keyset pagination, if any
+    next_cursor: int | None = None
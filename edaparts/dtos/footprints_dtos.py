@@ -39,6 +39,8 @@ class FootprintListResultDto(BaseModel):
     page_number: int
     total_elements: int
     elements: list[FootprintQueryDto]
+    # Cursor to fetch the next page with keyset pagination, if any
+    next_cursor: int | None = None
 
 
 class FootprintsComponentReferenceDto(BaseModel):
@@ -26,9 +26,12 @@
 import typing
 from typing import Optional, Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from edaparts.dtos.components_dtos import ComponentSpecificQueryDto
+from edaparts.dtos.components_dtos import (
+    ComponentSpecificQueryDto,
+    map_component_model_to_query_dto,
+)
 from edaparts.models.internal.internal_inventory_models import (
     MassStockMovement,
     SingleStockMovement,
@@ -67,7 +70,8 @@ class InventoryItemQueryDto(InventoryItemCreateRequestDto):
     component: ComponentSpecificQueryDto | None
 
     @staticmethod
-    def from_model(data, component_dto: ComponentSpecificQueryDto = None):
+    def from_model(data, include_component: bool = False):
+        # The component is only read if it was loaded alongside the item
         return InventoryItemQueryDto(
             id=data.id,
             mpn=data.mpn,
@@ -76,9 +80,21 @@ class InventoryItemQueryDto(InventoryItemCreateRequestDto):
             description=data.description,
             last_buy_price=data.last_buy_price,
             dici=data.dici,
-            component=component_dto,
+            component=(
+                map_component_model_to_query_dto(data.component)
+                if include_component and data.component
+                else None
+            ),
         )
 
+    @staticmethod
+    def from_models(
+        items: typing.Iterable, include_component: bool = False
+    ) -> list["InventoryItemQueryDto"]:
+        return [
+            InventoryItemQueryDto.from_model(item, include_component) for item in items
+        ]
+
 
 class InventoryItemsQueryDto(BaseModel):
     page_size: int
@@ -93,6 +109,9 @@ class InventoryLocationCreateDto(BaseModel):
 
 
 class InventoryLocationQueryDto(BaseModel):
+    # Read straight from the ORM model attributes by the pydantic core
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     dici: str
     name: str
@@ -100,9 +119,7 @@ class InventoryLocationQueryDto(BaseModel):
 
     @staticmethod
     def from_model(data: InventoryLocationModel):
-        return InventoryLocationQueryDto(
-            id=data.id, name=data.name, dici=data.dici, description=data.description
-        )
+        return InventoryLocationQueryDto.model_validate(data)
 
 
 class InventoryLocationsQueryDto(BaseModel):
@@ -122,6 +139,9 @@ class InventoryItemLocationStockUpdateResourceDto(BaseModel):
 
 
 class InventoryItemLocationStockQueryDto(InventoryItemLocationStockUpdateResourceDto):
+    # Read straight from the ORM model attributes by the pydantic core
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     actual_stock: float
 
@@ -129,12 +149,7 @@ class InventoryItemLocationStockQueryDto(InventoryItemLocationStockUpdateResourc
     def from_model(
         data: InventoryItemLocationStockModel,
     ) -> "InventoryItemLocationStockQueryDto":
-        return InventoryItemLocationStockQueryDto(
-            id=data.id,
-            actual_stock=data.actual_stock,
-            stock_min_level=data.stock_min_level,
-            stock_notify_min_level=data.stock_notify_min_level,
-        )
+        return InventoryItemLocationStockQueryDto.model_validate(data)
 
 
 class InventorySingleStockMovementRequestDto(BaseModel):
@@ -231,17 +246,15 @@ class InventoryCategoryCreateUpdateRequestDto(BaseModel):
 
 
 class InventoryCategoryQueryDto(InventoryCategoryCreateUpdateRequestDto):
+    # Read straight from the ORM model attributes by the pydantic core
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     parent_id: Optional[int]
 
     @staticmethod
     def from_model(data: InventoryCategoryModel) -> "InventoryCategoryQueryDto":
-        return InventoryCategoryQueryDto(
-            id=data.id,
-            name=data.name,
-            description=data.description,
-            parent_id=data.parent_id,
-        )
+        return InventoryCategoryQueryDto.model_validate(data)
 
 
 class InventoryCategoriesQueryDto(BaseModel):
@@ -249,6 +262,8 @@ class InventoryCategoriesQueryDto(BaseModel):
     page_number: int
     total_elements: int
     elements: list[InventoryCategoryQueryDto]
+    # Cursor to fetch the next page with keyset pagination, if any
+    next_cursor: int | None = None
 
 
 class InventoryCategoryReferenceCreationUpdateDto(BaseModel):
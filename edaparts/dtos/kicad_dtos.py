@@ -1,6 +1,7 @@
 import typing
 
 from pydantic import BaseModel
+from sqlalchemy import Row
 
 from edaparts.models.components.component_model import ComponentModel
 from edaparts.models.internal.kicad_models import KiCadPart, KiCadPartProperty
@@ -26,7 +27,7 @@ class CategoryPartQueryDto(BaseModel):
     description: typing.Optional[str]
 
     @staticmethod
-    def from_model(data: ComponentModel) -> "CategoryPartQueryDto":
+    def from_model(data: ComponentModel | Row) -> "CategoryPartQueryDto":
         return CategoryPartQueryDto(
             id=str(data.id),
             name=data.mpn,
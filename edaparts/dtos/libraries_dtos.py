@@ -44,19 +44,17 @@ class LibraryTypeEnum(Enum):
 
     @staticmethod
     def to_model(data: "LibraryTypeEnum") -> CadType:
-        if data == LibraryTypeEnum.ALTIUM:
-            return CadType.ALTIUM
-        if data == LibraryTypeEnum.KICAD:
-            return CadType.KICAD
-        raise ValueError(data)
+        model = _library_types_to_model.get(data)
+        if model is None:
+            raise ValueError(data)
+        return model
 
     @staticmethod
     def from_model(data: CadType) -> "LibraryTypeEnum":
-        if data == CadType.ALTIUM:
-            return LibraryTypeEnum.ALTIUM
-        if data == CadType.KICAD:
-            return LibraryTypeEnum.KICAD
-        raise ValueError(data)
+        dto = _library_types_from_model.get(data)
+        if dto is None:
+            raise ValueError(data)
+        return dto
 
 
 class StorageStatusEnum(Enum):
@@ -67,27 +65,36 @@ class StorageStatusEnum(Enum):
 
     @staticmethod
     def to_model(data: "StorageStatusEnum") -> StorageStatus:
-        if data == StorageStatusEnum.NOT_STORED:
-            return StorageStatus.NOT_STORED
-        if data == StorageStatusEnum.STORING:
-            return StorageStatus.STORING
-        if data == StorageStatusEnum.STORED:
-            return StorageStatus.STORED
-        if data == StorageStatusEnum.STORAGE_FAILED:
-            return StorageStatus.STORAGE_FAILED
-        raise ValueError(data)
+        model = _storage_statuses_to_model.get(data)
+        if model is None:
+            raise ValueError(data)
+        return model
 
     @staticmethod
     def from_model(data: StorageStatus) -> "StorageStatusEnum":
-        if data == StorageStatus.NOT_STORED:
-            return StorageStatusEnum.NOT_STORED
-        if data == StorageStatus.STORING:
-            return StorageStatusEnum.STORING
-        if data == StorageStatus.STORED:
-            return StorageStatusEnum.STORED
-        if data == StorageStatus.STORAGE_FAILED:
-            return StorageStatusEnum.STORAGE_FAILED
-        raise ValueError(data)
+        dto = _storage_statuses_from_model.get(data)
+        if dto is None:
+            raise ValueError(data)
+        return dto
+
+
+# Built once, the conversions are on the path of every library object mapping
+_library_types_to_model = {
+    LibraryTypeEnum.ALTIUM: CadType.ALTIUM,
+    LibraryTypeEnum.KICAD: CadType.KICAD,
+}
+_library_types_from_model = {
+    model: dto for dto, model in _library_types_to_model.items()
+}
+_storage_statuses_to_model = {
+    StorageStatusEnum.NOT_STORED: StorageStatus.NOT_STORED,
+    StorageStatusEnum.STORING: StorageStatus.STORING,
+    StorageStatusEnum.STORED: StorageStatus.STORED,
+    StorageStatusEnum.STORAGE_FAILED: StorageStatus.STORAGE_FAILED,
+}
+_storage_statuses_from_model = {
+    model: dto for dto, model in _storage_statuses_to_model.items()
+}
 
 
 class BaseLibraryQueryDto(BaseModel):
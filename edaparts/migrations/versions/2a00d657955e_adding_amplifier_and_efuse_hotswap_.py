@@ -11,7 +11,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
 
 # revision identifiers, used by Alembic.
 revision: str = "2a00d657955e"
@@ -19,75 +18,79 @@ down_revision: Union[str, None] = "f1ad6c343ede"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# SQL scripts of the views of this revision, read once when the migration is
+# loaded. The creation ones are sorted to always run them in the same order,
+# whatever the filesystem listing order is
+__views_path = pathlib.Path(__file__).parent.parent.joinpath("views", revision)
+__create_views_sql = b"\n".join(
+    view_file.read_bytes() for view_file in sorted(__views_path.glob("Create*.sql"))
+).decode("utf-8")
+__drop_views_sql = __views_path.joinpath("DropViews.sql").read_text(encoding="utf-8")
+
+# Same layout as the initial migration component subtype tables
+__string_30 = sa.String(length=30)
+__string_50 = sa.String(length=50)
+__string_250 = sa.String(length=250)
+
+__component_subtype_tables = {
+    "comp_amplifier": (
+        ("gain_bandwidth", __string_30),
+        ("output_type", __string_50),
+        ("input_type", __string_50),
+        ("amplifier_type", __string_50),
+        ("slew_rate", __string_30),
+        ("voltage_supplies", __string_30),
+        ("voltage_input_offset", __string_30),
+        ("current_output", __string_30),
+        ("number_of_channels", __string_30),
+        ("current_quiescent", __string_30),
+        ("cmrr", __string_30),
+        ("voltage_common_mode_max", __string_30),
+        ("voltage_input_max", __string_30),
+        ("bandwidth", __string_30),
+        ("features", __string_250),
+    ),
+    "comp_power_management_efuse_hotswap": (
+        ("fet_type", __string_50),
+        ("rds_on", __string_30),
+        ("current_max", __string_30),
+        ("current_min", __string_30),
+        ("voltage_input_min", __string_30),
+        ("voltage_input_max", __string_30),
+        ("current_over_response", __string_50),
+        ("voltage_over_response", __string_50),
+        ("features", __string_250),
+    ),
+}
+
 
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.create_table(
-        "comp_amplifier",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("gain_bandwidth", sa.String(length=30), nullable=True),
-        sa.Column("output_type", sa.String(length=50), nullable=True),
-        sa.Column("input_type", sa.String(length=50), nullable=True),
-        sa.Column("amplifier_type", sa.String(length=50), nullable=True),
-        sa.Column("slew_rate", sa.String(length=30), nullable=True),
-        sa.Column("voltage_supplies", sa.String(length=30), nullable=True),
-        sa.Column("voltage_input_offset", sa.String(length=30), nullable=True),
-        sa.Column("current_output", sa.String(length=30), nullable=True),
-        sa.Column("number_of_channels", sa.String(length=30), nullable=True),
-        sa.Column("current_quiescent", sa.String(length=30), nullable=True),
-        sa.Column("cmrr", sa.String(length=30), nullable=True),
-        sa.Column("voltage_common_mode_max", sa.String(length=30), nullable=True),
-        sa.Column("voltage_input_max", sa.String(length=30), nullable=True),
-        sa.Column("bandwidth", sa.String(length=30), nullable=True),
-        sa.Column("features", sa.String(length=250), nullable=True),
-        sa.ForeignKeyConstraint(
-            ["id"],
-            ["component.id"],
-        ),
-        sa.PrimaryKeyConstraint("id"),
+    for table_name, columns in __component_subtype_tables.items():
+        op.create_table(
+            table_name,
+            sa.Column(
+                "id", sa.Integer(), sa.ForeignKey("component.id"), primary_key=True
+            ),
+            *[sa.Column(name, type_, nullable=True) for name, type_ in columns],
+        )
+    # Run all the views creation scripts in a single round-trip. Each script
+    # is terminated by a semicolon, so they can be sent as one batch. Sent
+    # as-is, without bind parameters parsing
+    op.get_bind().exec_driver_sql(
+        __create_views_sql,
+        execution_options={"no_parameters": True},
     )
-    op.create_table(
-        "comp_power_management_efuse_hotswap",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("fet_type", sa.String(length=50), nullable=True),
-        sa.Column("rds_on", sa.String(length=30), nullable=True),
-        sa.Column("current_max", sa.String(length=30), nullable=True),
-        sa.Column("current_min", sa.String(length=30), nullable=True),
-        sa.Column("voltage_input_min", sa.String(length=30), nullable=True),
-        sa.Column("voltage_input_max", sa.String(length=30), nullable=True),
-        sa.Column("current_over_response", sa.String(length=50), nullable=True),
-        sa.Column("voltage_over_response", sa.String(length=50), nullable=True),
-        sa.Column("features", sa.String(length=250), nullable=True),
-        sa.ForeignKeyConstraint(
-            ["id"],
-            ["component.id"],
-        ),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    # Search for all the views creation SQL files
-    create_views = [
-        sql_file
-        for sql_file in pathlib.Path(__file__)
-        .parent.parent.joinpath("views", revision)
-        .glob("Create*.sql")
-    ]
-    # Run the views creation scripts
-    for view_file in create_views:
-        with open(view_file, "r") as f:
-            op.get_bind().execute(text(f.read()))
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # Drop the views
-    with open(
-        pathlib.Path(__file__).parent.parent.joinpath(
-            "views", revision, "DropViews.sql"
-        ),
-        "r",
-    ) as f:
-        op.get_bind().execute(text(f.read()))
-    op.drop_table("comp_power_management_efuse_hotswap")
-    op.drop_table("comp_amplifier")
+    op.get_bind().exec_driver_sql(
+        __drop_views_sql,
+        execution_options={"no_parameters": True},
+    )
+    for table_name in reversed(__component_subtype_tables):
+        op.drop_table(table_name)
     # ### end Alembic commands ###
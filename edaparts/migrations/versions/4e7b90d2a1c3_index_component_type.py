@@ -0,0 +1,25 @@
+"""Index component type
+
+Revision ID: 4e7b90d2a1c3
+Revises: d3a85e1c6f02
+Create Date: 2026-10-16 11:58:13.540867
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e7b90d2a1c3"
+down_revision: Union[str, None] = "d3a85e1c6f02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_component_type_id", "component", ["type", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_component_type_id", table_name="component")
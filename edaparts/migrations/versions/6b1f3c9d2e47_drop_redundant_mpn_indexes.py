@@ -0,0 +1,31 @@
+"""Drop redundant mpn indexes
+
+Revision ID: 6b1f3c9d2e47
+Revises: 2a00d657955e
+Create Date: 2026-10-16 09:12:40.318274
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1f3c9d2e47"
+down_revision: Union[str, None] = "2a00d657955e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # mpn is the leading column of the (mpn, manufacturer) unique constraints,
+    # so their backing indexes already serve mpn-only lookups
+    op.drop_index(op.f("ix_component_mpn"), table_name="component")
+    op.drop_index(op.f("ix_inventory_item_mpn"), table_name="inventory_item")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_inventory_item_mpn"), "inventory_item", ["mpn"], unique=False
+    )
+    op.create_index(op.f("ix_component_mpn"), "component", ["mpn"], unique=False)
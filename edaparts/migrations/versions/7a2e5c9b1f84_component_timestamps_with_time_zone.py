@@ -0,0 +1,86 @@
+"""Component timestamps with time zone
+
+Revision ID: 7a2e5c9b1f84
+Revises: b5d2f8a4c9e1
+Create Date: 2026-10-16 13:07:41.263590
+
+"""
+
+import pathlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2e5c9b1f84"
+down_revision: Union[str, None] = "b5d2f8a4c9e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# All the component views select the timestamps, and PostgreSQL refuses to
+# change the type of a column used by a view, so they are dropped and created
+# again around the change, oldest revision first
+__views_revisions = ("f1ad6c343ede", "2a00d657955e")
+__views_path = pathlib.Path(__file__).parent.parent.joinpath("views")
+__drop_views_sql = b"\n".join(
+    __views_path.joinpath(views_revision, "DropViews.sql").read_bytes()
+    for views_revision in reversed(__views_revisions)
+).decode("utf-8")
+__create_views_sql = b"\n".join(
+    view_file.read_bytes()
+    for views_revision in __views_revisions
+    for view_file in sorted(__views_path.joinpath(views_revision).glob("Create*.sql"))
+).decode("utf-8")
+
+__timestamp_columns = ("created_on", "updated_on")
+
+
+def __drop_views() -> None:
+    op.get_bind().exec_driver_sql(
+        __drop_views_sql, execution_options={"no_parameters": True}
+    )
+
+
+def __create_views() -> None:
+    op.get_bind().exec_driver_sql(
+        __create_views_sql, execution_options={"no_parameters": True}
+    )
+
+
+def upgrade() -> None:
+    __drop_views()
+    # The stored values come from now() in the session time zone, that is the
+    # same one the cast uses to interpret them
+    for column in __timestamp_columns:
+        op.alter_column(
+            "component",
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=True,
+        )
+    __create_views()
+    # Rows are inserted in creation order, so a BRIN index is enough to
+    # range-scan and sort by creation time at a fraction of a btree size
+    op.create_index(
+        "ix_component_created_on_brin",
+        "component",
+        ["created_on"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_component_created_on_brin", table_name="component")
+    __drop_views()
+    for column in __timestamp_columns:
+        op.alter_column(
+            "component",
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=True,
+        )
+    __create_views()
@@ -0,0 +1,54 @@
+"""Index foreign key columns and add association tables primary keys
+
+Revision ID: 9c4e2a7f5d18
+Revises: 6b1f3c9d2e47
+Create Date: 2026-10-16 09:47:05.602931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e2a7f5d18"
+down_revision: Union[str, None] = "6b1f3c9d2e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__association_tables = (
+    ("component_footprint_asc", "footprint_ref_id"),
+    ("component_library_asc", "library_ref_id"),
+)
+
+__fk_indexes = (
+    ("inventory_item", "component_id"),
+    ("inventory_item", "category_id"),
+    ("inventory_item_location_stock", "item_id"),
+    ("inventory_item_location_stock", "location_id"),
+    ("inventory_item_location_stock_movement", "stock_item_id"),
+)
+
+
+def upgrade() -> None:
+    for table, ref_column in __association_tables:
+        # Nothing prevented duplicated relations before, drop them so the
+        # primary key can be created
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE a.ctid < b.ctid AND a.component_id = b.component_id "
+            f"AND a.{ref_column} = b.{ref_column}"
+        )
+        op.create_primary_key(f"{table}_pkey", table, ["component_id", ref_column])
+        # The PK covers component_id lookups, index the reverse side
+        op.create_index(op.f(f"ix_{table}_{ref_column}"), table, [ref_column])
+    for table, column in __fk_indexes:
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column])
+
+
+def downgrade() -> None:
+    for table, column in reversed(__fk_indexes):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+    for table, ref_column in reversed(__association_tables):
+        op.drop_index(op.f(f"ix_{table}_{ref_column}"), table_name=table)
+        op.drop_constraint(f"{table}_pkey", table, type_="primary")
@@ -0,0 +1,42 @@
+"""Cover association tables reverse lookups
+
+Revision ID: b5d2f8a4c9e1
+Revises: 4e7b90d2a1c3
+Create Date: 2026-10-16 12:26:47.091358
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d2f8a4c9e1"
+down_revision: Union[str, None] = "4e7b90d2a1c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__association_tables = (
+    ("component_footprint_asc", "footprint_ref_id"),
+    ("component_library_asc", "library_ref_id"),
+)
+
+
+def upgrade() -> None:
+    for table, ref_column in __association_tables:
+        # Replace the single column index by one that also carries the
+        # component id, so reference -> components lookups are index-only
+        op.create_index(
+            op.f(f"ix_{table}_{ref_column}_component_id"),
+            table,
+            [ref_column, "component_id"],
+        )
+        op.drop_index(op.f(f"ix_{table}_{ref_column}"), table_name=table)
+
+
+def downgrade() -> None:
+    for table, ref_column in reversed(__association_tables):
+        op.create_index(op.f(f"ix_{table}_{ref_column}"), table, [ref_column])
+        op.drop_index(
+            op.f(f"ix_{table}_{ref_column}_component_id"), table_name=table
+        )
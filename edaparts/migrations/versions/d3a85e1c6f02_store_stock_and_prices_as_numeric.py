@@ -0,0 +1,48 @@
+"""Store stock levels and prices as numeric
+
+Revision ID: d3a85e1c6f02
+Revises: 9c4e2a7f5d18
+Create Date: 2026-10-16 10:31:52.177406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a85e1c6f02"
+down_revision: Union[str, None] = "9c4e2a7f5d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+__numeric_columns = (
+    ("inventory_item", "last_buy_price", True),
+    ("inventory_item_location_stock", "actual_stock", False),
+    ("inventory_item_location_stock", "stock_min_level", True),
+    ("inventory_item_location_stock", "stock_notify_min_level", True),
+    ("inventory_item_location_stock_movement", "stock_change", False),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in __numeric_columns:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision=14, scale=4),
+            existing_type=sa.Float(),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in __numeric_columns:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(precision=14, scale=4),
+            existing_nullable=nullable,
+        )
@@ -11,7 +11,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = "f1ad6c343ede"
@@ -19,9 +19,55 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# SQL scripts of the views of this revision, read once when the migration is
+# loaded. The creation ones are sorted to always run them in the same order,
+# whatever the filesystem listing order is
+__views_path = pathlib.Path(__file__).parent.parent.joinpath("views", revision)
+__create_views_sql = b"\n".join(
+    view_file.read_bytes() for view_file in sorted(__views_path.glob("Create*.sql"))
+).decode("utf-8")
+__drop_views_sql = __views_path.joinpath("DropViews.sql").read_text(encoding="utf-8")
+
+# Shared by footprint_ref and library_ref. Created once, explicitly, instead of
+# letting each create_table call probe the catalog and emit its own CREATE TYPE
+storage_status_enum = postgresql.ENUM(
+    "NOT_STORED",
+    "STORING",
+    "STORED",
+    "STORAGE_FAILED",
+    "DELETING",
+    name="storagestatus",
+    create_type=False,
+)
+cad_type_enum = postgresql.ENUM("ALTIUM", "KICAD", name="cadtype", create_type=False)
+
+# Created once all the tables are in place, so any data loaded by the table
+# creation steps doesn't pay for index maintenance
+__indexes = (
+    ("ix_component_manufacturer", "component", ["manufacturer"]),
+    ("ix_component_mpn", "component", ["mpn"]),
+    ("ix_inventory_location_dici", "inventory_location", ["dici"]),
+    ("ix_inventory_item_dici", "inventory_item", ["dici"]),
+    ("ix_inventory_item_manufacturer", "inventory_item", ["manufacturer"]),
+    ("ix_inventory_item_mpn", "inventory_item", ["mpn"]),
+    (
+        "ix_inventory_item_property_property_name",
+        "inventory_item_property",
+        ["property_name"],
+    ),
+)
+
 
 def upgrade() -> None:
+    # Create the extension we use for the views. It's idempotent and nothing
+    # has been created yet, so it's committed on its own instead of keeping
+    # its catalog locks for the whole schema creation transaction
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS tablefunc")
+
     # ### commands auto generated by Alembic - please adjust! ###
+    storage_status_enum.create(op.get_bind(), checkfirst=False)
+    cad_type_enum.create(op.get_bind(), checkfirst=False)
     op.create_table(
         "component",
         sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
@@ -45,10 +91,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("mpn", "manufacturer", name="_mpn_manufacturer_uc"),
     )
-    op.create_index(
-        op.f("ix_component_manufacturer"), "component", ["manufacturer"], unique=False
-    )
-    op.create_index(op.f("ix_component_mpn"), "component", ["mpn"], unique=False)
     op.create_table(
         "footprint_ref",
         sa.Column("id", sa.Integer(), nullable=False),
@@ -58,20 +100,11 @@ def upgrade() -> None:
         sa.Column("description", sa.String(length=300), nullable=True),
         sa.Column(
             "storage_status",
-            sa.Enum(
-                "NOT_STORED",
-                "STORING",
-                "STORED",
-                "STORAGE_FAILED",
-                "DELETING",
-                name="storagestatus",
-            ),
+            storage_status_enum,
             nullable=False,
         ),
         sa.Column("storage_error", sa.String(length=1024), nullable=True),
-        sa.Column(
-            "cad_type", sa.Enum("ALTIUM", "KICAD", name="cadtype"), nullable=False
-        ),
+        sa.Column("cad_type", cad_type_enum, nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_table(
@@ -96,9 +129,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("name"),
     )
-    op.create_index(
-        op.f("ix_inventory_location_dici"), "inventory_location", ["dici"], unique=False
-    )
     op.create_table(
         "library_ref",
         sa.Column("id", sa.Integer(), nullable=False),
@@ -108,20 +138,11 @@ def upgrade() -> None:
         sa.Column("description", sa.String(length=300), nullable=True),
         sa.Column(
             "storage_status",
-            sa.Enum(
-                "NOT_STORED",
-                "STORING",
-                "STORED",
-                "STORAGE_FAILED",
-                "DELETING",
-                name="storagestatus",
-            ),
+            storage_status_enum,
             nullable=False,
         ),
         sa.Column("storage_error", sa.String(length=1024), nullable=True),
-        sa.Column(
-            "cad_type", sa.Enum("ALTIUM", "KICAD", name="cadtype"), nullable=False
-        ),
+        sa.Column("cad_type", cad_type_enum, nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_table(
@@ -665,18 +686,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("mpn", "manufacturer", name="_mpn_manufacturer_item_uc"),
     )
-    op.create_index(
-        op.f("ix_inventory_item_dici"), "inventory_item", ["dici"], unique=False
-    )
-    op.create_index(
-        op.f("ix_inventory_item_manufacturer"),
-        "inventory_item",
-        ["manufacturer"],
-        unique=False,
-    )
-    op.create_index(
-        op.f("ix_inventory_item_mpn"), "inventory_item", ["mpn"], unique=False
-    )
     op.create_table(
         "inventory_item_location_stock",
         sa.Column("id", sa.Integer(), nullable=False),
@@ -710,12 +719,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("item_id", "property_name", name="_item_prop_uc"),
     )
-    op.create_index(
-        op.f("ix_inventory_item_property_property_name"),
-        "inventory_item_property",
-        ["property_name"],
-        unique=False,
-    )
     op.create_table(
         "inventory_item_location_stock_movement",
         sa.Column("id", sa.Integer(), nullable=False),
@@ -731,45 +734,33 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    # Create the extension we use for the views
-    op.execute("CREATE EXTENSION IF NOT EXISTS tablefunc")
+    for index_name, table_name, columns in __indexes:
+        op.create_index(op.f(index_name), table_name, columns, unique=False)
 
-    # Search for all the views creation SQL files
-    create_views = [
-        sql_file
-        for sql_file in pathlib.Path(__file__)
-        .parent.parent.joinpath("views", revision)
-        .glob("Create*.sql")
-    ]
-    # Run the views creation scripts
-    for view_file in create_views:
-        with open(view_file, "r") as f:
-            op.get_bind().execute(text(f.read()))
+    # Run all the views creation scripts in a single round-trip. Each script
+    # is terminated by a semicolon, so they can be sent as one batch. Sent
+    # as-is, without bind parameters parsing
+    op.get_bind().exec_driver_sql(
+        __create_views_sql,
+        execution_options={"no_parameters": True},
+    )
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # Drop the views
-    with open(
-        pathlib.Path(__file__).parent.parent.joinpath(
-            "views", revision, "DropViews.sql"
-        ),
-        "r",
-    ) as f:
-        op.get_bind().execute(text(f.read()))
+    op.get_bind().exec_driver_sql(
+        __drop_views_sql,
+        execution_options={"no_parameters": True},
+    )
     # Drop the tablefunc extension we use for the views
     op.execute("DROP EXTENSION IF EXISTS tablefunc")
+    for index_name, table_name, _ in reversed(__indexes):
+        op.drop_index(op.f(index_name), table_name=table_name)
     op.drop_table("inventory_item_location_stock_movement")
-    op.drop_index(
-        op.f("ix_inventory_item_property_property_name"),
-        table_name="inventory_item_property",
-    )
     op.drop_table("inventory_item_property")
     op.drop_table("inventory_item_location_stock")
-    op.drop_index(op.f("ix_inventory_item_mpn"), table_name="inventory_item")
-    op.drop_index(op.f("ix_inventory_item_manufacturer"), table_name="inventory_item")
-    op.drop_index(op.f("ix_inventory_item_dici"), table_name="inventory_item")
     op.drop_table("inventory_item")
     op.drop_table("component_library_asc")
     op.drop_table("component_footprint_asc")
@@ -807,11 +798,10 @@ def downgrade() -> None:
     op.drop_table("comp_capacitor_electrolytic")
     op.drop_table("comp_capacitor_ceramic")
     op.drop_table("library_ref")
-    op.drop_index(op.f("ix_inventory_location_dici"), table_name="inventory_location")
     op.drop_table("inventory_location")
     op.drop_table("inventory_category")
     op.drop_table("footprint_ref")
-    op.drop_index(op.f("ix_component_mpn"), table_name="component")
-    op.drop_index(op.f("ix_component_manufacturer"), table_name="component")
     op.drop_table("component")
+    cad_type_enum.drop(op.get_bind(), checkfirst=False)
+    storage_status_enum.drop(op.get_bind(), checkfirst=False)
     # ### end Alembic commands ###
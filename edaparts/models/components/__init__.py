@@ -21,6 +21,8 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 #
+import typing
+
 from edaparts.models.components.amplifier_model import AmplifierModel
 from edaparts.models.components.capacitor_ceramic_model import CapacitorCeramicModel
 from edaparts.models.components.capacitor_electrolytic_model import (
@@ -69,40 +71,50 @@ from edaparts.models.components.oscillator_oscillator_model import (
     OscillatorOscillatorModel,
 )
 
-ComponentModelType = (
-    AmplifierModel
-    | CapacitorCeramicModel
-    | CapacitorElectrolyticModel
-    | CapacitorTantalumModel
-    | ConnectorPcbModel
-    | CrystalOscillatorModel
-    | DiodeRectifierModel
-    | DiodeTVSModel
-    | DiodeZenerModel
-    | DiscreteLogicModel
-    | FerriteBeadModel
-    | FusePPTCModel
-    | InductorChokeModel
-    | LedIndicatorModel
-    | MemoryModel
-    | MicrocontrollerModel
-    | OpAmpModel
-    | OptocouplerDigitalModel
-    | OptocouplerLinearModel
-    | OscillatorOscillatorModel
-    | PotentiometerModel
-    | PowerInductorModel
-    | PowerManagementEFuseHotSwapModel
-    | ResistorModel
-    | SwitchPushButtonModel
-    | SwitchSwitchModel
-    | TransceiverModel
-    | TransducerModel
-    | TransformerModel
-    | TransistorArrayMosfetModel
-    | TransistorBjtModel
-    | TransistorMosfetModel
-    | TriacModel
-    | VoltageRegulatorDCDCModel
-    | VoltageRegulatorLinearModel
+# All the concrete component models. Being a tuple it can be given to
+# isinstance() as-is and used to derive lookup tables
+COMPONENT_MODEL_CLASSES = (
+    AmplifierModel,
+    CapacitorCeramicModel,
+    CapacitorElectrolyticModel,
+    CapacitorTantalumModel,
+    ConnectorPcbModel,
+    CrystalOscillatorModel,
+    DiodeRectifierModel,
+    DiodeTVSModel,
+    DiodeZenerModel,
+    DiscreteLogicModel,
+    FerriteBeadModel,
+    FusePPTCModel,
+    InductorChokeModel,
+    LedIndicatorModel,
+    MemoryModel,
+    MicrocontrollerModel,
+    OpAmpModel,
+    OptocouplerDigitalModel,
+    OptocouplerLinearModel,
+    OscillatorOscillatorModel,
+    PotentiometerModel,
+    PowerInductorModel,
+    PowerManagementEFuseHotSwapModel,
+    ResistorModel,
+    SwitchPushButtonModel,
+    SwitchSwitchModel,
+    TransceiverModel,
+    TransducerModel,
+    TransformerModel,
+    TransistorArrayMosfetModel,
+    TransistorBjtModel,
+    TransistorMosfetModel,
+    TriacModel,
+    VoltageRegulatorDCDCModel,
+    VoltageRegulatorLinearModel,
 )
+
+ComponentModelType = typing.Union[COMPONENT_MODEL_CLASSES]
+
+# Component models indexed by their polymorphic identity (their table name)
+COMPONENT_MODELS_BY_IDENTITY = {
+    model.__mapper__.polymorphic_identity: model
+    for model in COMPONENT_MODEL_CLASSES
+}
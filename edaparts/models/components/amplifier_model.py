@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class AmplifierModel(ComponentModel):
+class AmplifierModel(ComponentChildModel):
     __tablename__ = "comp_amplifier"
     __id_prefix__ = "AMPL"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of an amplifier
     gain_bandwidth = Column(String(30))
     output_type = Column(String(50))
@@ -50,8 +47,3 @@ class AmplifierModel(ComponentModel):
     voltage_input_max = Column(String(30))
     bandwidth = Column(String(30))
     features = Column(String(250))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
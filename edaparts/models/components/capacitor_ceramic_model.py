@@ -23,23 +23,15 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class CapacitorCeramicModel(ComponentModel):
+class CapacitorCeramicModel(ComponentChildModel):
     __tablename__ = "comp_capacitor_ceramic"
     __id_prefix__ = "CAPC"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a ceramic capacitor
     tolerance = Column(String(30))
     voltage = Column(String(30))
     composition = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
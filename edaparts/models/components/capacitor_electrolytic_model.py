@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey, Boolean
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String, Boolean
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class CapacitorElectrolyticModel(ComponentModel):
+class CapacitorElectrolyticModel(ComponentChildModel):
     __tablename__ = "comp_capacitor_electrolytic"
     __id_prefix__ = "CAPE"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of an electrolytic capacitor
     tolerance = Column(String(30))
     voltage = Column(String(30))
@@ -41,8 +38,3 @@ class CapacitorElectrolyticModel(ComponentModel):
     polarised = Column(Boolean())
     esr = Column(String(30))
     lifetime_temperature = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
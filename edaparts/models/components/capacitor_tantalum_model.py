@@ -23,24 +23,16 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class CapacitorTantalumModel(ComponentModel):
+class CapacitorTantalumModel(ComponentChildModel):
     __tablename__ = "comp_capacitor_tantalum"
     __id_prefix__ = "CAPT"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a tantalum capacitor
     tolerance = Column(String(30))
     voltage = Column(String(30))
     lifetime_temperature = Column(String(30))
     esr = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
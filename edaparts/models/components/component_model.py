@@ -29,11 +29,12 @@ from sqlalchemy import (
     Integer,
     DateTime,
     UniqueConstraint,
+    Index,
     ForeignKey,
     Boolean,
     func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import declared_attr, relationship
 
 from edaparts.models.inventory.inventory_identificable_item_model import (
     InventoryIdentificableItemModel,
@@ -55,10 +56,12 @@ class ComponentModel(InventoryIdentificableItemModel):
     type = Column(String(50))
 
     # General component properties
-    mpn = Column(String(100), nullable=False, index=True)
+    mpn = Column(String(100), nullable=False)
     manufacturer = Column(String(100), nullable=False, index=True)
-    created_on = Column(DateTime(), server_default=func.now())
-    updated_on = Column(DateTime(), server_default=func.now(), onupdate=func.now())
+    created_on = Column(DateTime(timezone=True), server_default=func.now())
+    updated_on = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
     value = Column(String(100))
     package = Column(String(100))
     description = Column(String(200))
@@ -89,9 +92,37 @@ class ComponentModel(InventoryIdentificableItemModel):
         "polymorphic_identity": "component",
         "polymorphic_on": type,
         "with_polymorphic": "*",
+        # Fetch the server generated timestamps with RETURNING on INSERT and
+        # UPDATE, instead of expiring them and reloading them afterwards
+        "eager_defaults": True,
     }
 
-    # Set a constraint that enforces Part Number - Manufacturer uniqueness
+    # Set a constraint that enforces Part Number - Manufacturer uniqueness and
+    # index the type column for type filtered lookups ordered by id. Creation time
+    # grows with the insertion order, so a BRIN index covers it
     __table_args__ = (
         UniqueConstraint("mpn", "manufacturer", name="_mpn_manufacturer_uc"),
+        Index("ix_component_type_id", "type", "id"),
+        Index("ix_component_created_on_brin", "created_on", postgresql_using="brin"),
     )
+
+
+class ComponentChildModel(ComponentModel):
+    """
+    Base of every specific component type. Each child only declares its table,
+    its id prefix and its own columns. The primary key, a FK to the parent
+    component, and the polymorphic identity are derived from the table name.
+    """
+
+    __abstract__ = True
+
+    @declared_attr
+    def id(cls):
+        return Column(ForeignKey("component.id"), primary_key=True)
+
+    # Tells the ORM the type of a specific component by the distinguish column
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        return {
+            "polymorphic_identity": cls.__tablename__,
+        }
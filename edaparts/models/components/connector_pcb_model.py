@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class ConnectorPcbModel(ComponentModel):
+class ConnectorPcbModel(ComponentChildModel):
     __tablename__ = "comp_connector_pcb"
     __id_prefix__ = "CONP"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a PCB connector
     orientation = Column(String(50))
     pitch = Column(String(30))
@@ -41,8 +38,3 @@ class ConnectorPcbModel(ComponentModel):
     current_rating = Column(String(30))
     number_of_rows = Column(String(30))
     number_of_contacts = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
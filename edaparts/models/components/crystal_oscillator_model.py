@@ -23,23 +23,15 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class CrystalOscillatorModel(ComponentModel):
+class CrystalOscillatorModel(ComponentChildModel):
     __tablename__ = "comp_crystal_oscillator"
     __id_prefix__ = "XTAL"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a crystal oscillator
     load_capacitance = Column(String(30))
     frequency = Column(String(30))
     frequency_tolerance = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
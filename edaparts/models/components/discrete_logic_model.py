@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class DiscreteLogicModel(ComponentModel):
+class DiscreteLogicModel(ComponentChildModel):
     __tablename__ = "comp_discrete_logic"
     __id_prefix__ = "LGIC"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a discrete logic component
     logic_family = Column(String(30))
     logic_type = Column(String(30))
@@ -42,8 +39,3 @@ class DiscreteLogicModel(ComponentModel):
     supply_voltage_max = Column(String(30))
     supply_voltage_min = Column(String(30))
     logic_function = Column(String(100))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class FusePPTCModel(ComponentModel):
+class FusePPTCModel(ComponentChildModel):
     __tablename__ = "comp_fuse_pptc"
     __id_prefix__ = "PPTC"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a PPTC fuse
     current_hold = Column(String(30))
     current_trip = Column(String(30))
@@ -42,8 +39,3 @@ class FusePPTCModel(ComponentModel):
     resistance_minimum = Column(String(30))
     power_rating = Column(String(30))
     current_rating = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
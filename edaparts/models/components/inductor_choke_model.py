@@ -22,24 +22,16 @@
 #  SOFTWARE.
 #
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class InductorChokeModel(ComponentModel):
+class InductorChokeModel(ComponentChildModel):
     __tablename__ = "comp_inductor_choke"
     __id_prefix__ = "ICHK"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of an inductor choke
     number_of_lines = Column(String(30))
     dc_resistance = Column(String(30))
     impedance_freq = Column(String(30))
     current_rating = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
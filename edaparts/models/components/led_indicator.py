@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class LedIndicatorModel(ComponentModel):
+class LedIndicatorModel(ComponentChildModel):
     __tablename__ = "comp_led_indicator"
     __id_prefix__ = "LEDI"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a led indicator
     forward_voltage = Column(String(30))
     color = Column(String(30))
@@ -42,8 +39,3 @@ class LedIndicatorModel(ComponentModel):
     dominant_wavelength = Column(String(30))
     test_current = Column(String(30))
     lens_size = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
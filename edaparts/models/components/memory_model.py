@@ -23,24 +23,16 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class MemoryModel(ComponentModel):
+class MemoryModel(ComponentChildModel):
     __tablename__ = "comp_memory"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a memory
     technology = Column(String(50))
     memory_type = Column(String(50))
     size = Column(String(30))
     interface = Column(String(50))
     clock_frequency = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
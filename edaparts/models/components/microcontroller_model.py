@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class MicrocontrollerModel(ComponentModel):
+class MicrocontrollerModel(ComponentChildModel):
     __tablename__ = "comp_microcontroller"
     __id_prefix__ = "MCRO"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a resistor
     core = Column(String(50))
     core_size = Column(String(30))
@@ -43,8 +40,3 @@ class MicrocontrollerModel(ComponentModel):
     peripherals = Column(String(250))
     connectivity = Column(String(250))
     voltage_supply = Column(String(50))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
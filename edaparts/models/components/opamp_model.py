@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class OpAmpModel(ComponentModel):
+class OpAmpModel(ComponentChildModel):
     __tablename__ = "comp_opamp"
     __id_prefix__ = "OAMP"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a resistor
     gain_bandwith = Column(String(30))
     output_type = Column(String(50))
@@ -44,8 +41,3 @@ class OpAmpModel(ComponentModel):
     voltage_input_offset = Column(String(30))
     current_output = Column(String(30))
     number_of_channels = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class OptocouplerDigitalModel(ComponentModel):
+class OptocouplerDigitalModel(ComponentChildModel):
     __tablename__ = "comp_optocoupler_digital"
     __id_prefix__ = "OPTD"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a digital optocoupler
     voltage_isolation = Column(String(30))
     voltage_saturation_max = Column(String(30))
@@ -42,8 +39,3 @@ class OptocouplerDigitalModel(ComponentModel):
     voltage_forward_typical = Column(String(30))
     voltage_output_max = Column(String(30))
     number_of_channels = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
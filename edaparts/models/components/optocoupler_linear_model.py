@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class OptocouplerLinearModel(ComponentModel):
+class OptocouplerLinearModel(ComponentChildModel):
     __tablename__ = "comp_optocoupler_linear"
     __id_prefix__ = "OPTA"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a linear optocoupler
     voltage_isolation = Column(String(30))
     transfer_gain = Column(String(30))
@@ -41,8 +38,3 @@ class OptocouplerLinearModel(ComponentModel):
     servo_gain = Column(String(30))
     forward_gain = Column(String(30))
     non_linearity = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class OscillatorOscillatorModel(ComponentModel):
+class OscillatorOscillatorModel(ComponentChildModel):
     __tablename__ = "comp_oscillator_oscillator"
     __id_prefix__ = "XOSC"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a oscillator
     base_resonator = Column(String(30))
     current_supply_max = Column(String(30))
@@ -41,8 +38,3 @@ class OscillatorOscillatorModel(ComponentModel):
     frequency_stability = Column(String(30))
     voltage_supply = Column(String(30))
     output_type = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,25 +23,17 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class PotentiometerModel(ComponentModel):
+class PotentiometerModel(ComponentChildModel):
     __tablename__ = "comp_potentiometer"
     __id_prefix__ = "RPOT"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a resistor
     power_max = Column(String(30))
     tolerance = Column(String(30))
     resistance_min = Column(String(30))
     resistance_max = Column(String(30))
     number_of_turns = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
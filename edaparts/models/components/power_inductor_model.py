@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class PowerInductorModel(ComponentModel):
+class PowerInductorModel(ComponentChildModel):
     __tablename__ = "comp_power_inductor"
     __id_prefix__ = "PIND"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of an inductor
     tolerance = Column(String(30))
     resistance_dcr = Column(String(30))
@@ -41,8 +38,3 @@ class PowerInductorModel(ComponentModel):
     current_rating = Column(String(30))
     current_saturation = Column(String(30))
     core_material = Column(String(50))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
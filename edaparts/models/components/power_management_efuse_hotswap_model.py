@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class PowerManagementEFuseHotSwapModel(ComponentModel):
+class PowerManagementEFuseHotSwapModel(ComponentChildModel):
     __tablename__ = "comp_power_management_efuse_hotswap"
     __id_prefix__ = "PMEH"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of an eFuse/Hotswap controller
     fet_type = Column(String(50))
     rds_on = Column(String(30))
@@ -44,8 +41,3 @@ class PowerManagementEFuseHotSwapModel(ComponentModel):
     current_over_response = Column(String(50))
     voltage_over_response = Column(String(50))
     features = Column(String(250))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
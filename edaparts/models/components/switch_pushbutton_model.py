@@ -23,25 +23,17 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class SwitchPushButtonModel(ComponentModel):
+class SwitchPushButtonModel(ComponentChildModel):
     __tablename__ = "comp_switch_push_button"
     __id_prefix__ = "SBUT"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a pushbutton
     function = Column(String(50))
     dc_voltage_rating = Column(String(30))
     ac_voltage_rating = Column(String(30))
     current_rating = Column(String(30))
     circuit_type = Column(String(50))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
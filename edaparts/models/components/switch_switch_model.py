@@ -23,24 +23,16 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class SwitchSwitchModel(ComponentModel):
+class SwitchSwitchModel(ComponentChildModel):
     __tablename__ = "comp_switch_switch"
     __id_prefix__ = "SWIT"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a switch
     voltage_rating = Column(String(30))
     current_rating = Column(String(30))
     number_of_positions = Column(String(30))
     circuit_type = Column(String(50))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
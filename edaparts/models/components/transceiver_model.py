@@ -23,24 +23,16 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransceiverModel(ComponentModel):
+class TransceiverModel(ComponentChildModel):
     __tablename__ = "comp_transceiver"
     __id_prefix__ = "XCVR"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a transceiver
     duplex = Column(String(30))
     data_rate = Column(String(30))
     protocol = Column(String(30))
     voltage_supply = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,24 +23,16 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransducerModel(ComponentModel):
+class TransducerModel(ComponentChildModel):
     __tablename__ = "comp_transducer"
     __id_prefix__ = "XDCR"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a transducer
     input_magnitude = Column(String(50))
     output_type = Column(String(50))
     proportional_gain = Column(String(50))
     supply_voltage = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -22,17 +22,14 @@
 #  SOFTWARE.
 #
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransformerModel(ComponentModel):
+class TransformerModel(ComponentChildModel):
     __tablename__ = "comp_transformer"
     __id_prefix__ = "TFRM"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a transformer
     number_of_windings = Column(String(30))
     primary_dc_resistance = Column(String(30))
@@ -47,8 +44,3 @@ class TransformerModel(ComponentModel):
     tertiary_voltage_rating = Column(String(30))
     nps_turns_ratio = Column(String(30))
     npt_turns_ratio = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransistorArrayMosfetModel(ComponentModel):
+class TransistorArrayMosfetModel(ComponentChildModel):
     __tablename__ = "comp_transistor_array_mosfet"
     __id_prefix__ = "QARR"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a MOSFET array
     number_of_channels = Column(String(30))
     rds_on = Column(String(30))
@@ -44,8 +41,3 @@ class TransistorArrayMosfetModel(ComponentModel):
     current_total_max = Column(String(30))
     power_max = Column(String(30))
     channel_type = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransistorBjtModel(ComponentModel):
+class TransistorBjtModel(ComponentChildModel):
     __tablename__ = "comp_transistor_bjt"
     __id_prefix__ = "QBJT"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a BJT
     vce_sat_max = Column(String(30))
     hfe = Column(String(30))
@@ -41,8 +38,3 @@ class TransistorBjtModel(ComponentModel):
     ic_max = Column(String(50))
     power_max = Column(String(50))
     bjt_type = Column(String(10))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TransistorMosfetModel(ComponentModel):
+class TransistorMosfetModel(ComponentChildModel):
     __tablename__ = "comp_transistor_mosfet"
     __id_prefix__ = "QFET"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a MOSFET
     rds_on = Column(String(30))
     vgs_max = Column(String(30))
@@ -42,8 +39,3 @@ class TransistorMosfetModel(ComponentModel):
     ids_max = Column(String(30))
     power_max = Column(String(30))
     channel_type = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,15 +23,13 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class TriacModel(ComponentModel):
+class TriacModel(ComponentChildModel):
     __tablename__ = "comp_triac"
     __id_prefix__ = "TRIA"
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
 
     # Specific properties of a triac
     power_max = Column(String(30))
@@ -45,8 +43,3 @@ class TriacModel(ComponentModel):
     emitter_forward_current = Column(String(30))
     emitter_forward_voltage = Column(String(30))
     triac_type = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class VoltageRegulatorDCDCModel(ComponentModel):
+class VoltageRegulatorDCDCModel(ComponentChildModel):
     __tablename__ = "comp_voltage_regulator_dcdc"
     __id_prefix__ = "DCDC"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a resistor
     voltage_input_min = Column(String(30))
     voltage_output_min_fixed = Column(String(30))
@@ -43,8 +40,3 @@ class VoltageRegulatorDCDCModel(ComponentModel):
     topology = Column(String(50))
     output_type = Column(String(50))
     number_of_outputs = Column(String(30))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -23,17 +23,14 @@
 #
 
 
-from sqlalchemy import Column, String, ForeignKey
-from edaparts.models.components.component_model import ComponentModel
+from sqlalchemy import Column, String
+from edaparts.models.components.component_model import ComponentChildModel
 
 
-class VoltageRegulatorLinearModel(ComponentModel):
+class VoltageRegulatorLinearModel(ComponentChildModel):
     __tablename__ = "comp_voltage_regulator_linear"
     __id_prefix__ = "REGL"
 
-    # Primary key
-    id = Column(ForeignKey("component.id"), primary_key=True)
-
     # Specific properties of a resistor
     gain_bandwith = Column(String(50))
     output_type = Column(String(50))
@@ -43,8 +40,3 @@ class VoltageRegulatorLinearModel(ComponentModel):
     current_supply_max = Column(String(30))
     current_output = Column(String(30))
     pssr = Column(String(50))
-
-    # Tells the ORM the type of a specific component by the distinguish column
-    __mapper_args__ = {
-        "polymorphic_identity": __tablename__,
-    }
@@ -24,20 +24,20 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingleStockMovement:
     item_identifier: int | str
     location_identifier: int | str
     quantity: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MassStockMovement:
     reason: str
     movements: list[SingleStockMovement]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InventoryItemStockStatus:
     stock_level: float
     item_dici: str
@@ -45,7 +45,7 @@ class StorageStatus(Enum):
     DELETING = "DELETING"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorableObjectRequest:
     filename: pathlib.Path
     path: str
@@ -55,7 +55,7 @@ class StorableObjectRequest:
     description: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorableObjectCreateReuseRequest:
     """
     Request to create a new object based on an already existing file.
@@ -68,7 +68,7 @@ class StorableObjectCreateReuseRequest:
     description: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorableObjectUpdateRequest:
     """
     Request to update an existing object without touching its associated file.
@@ -80,7 +80,7 @@ class StorableObjectUpdateRequest:
     description: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorableObjectDataUpdateRequest:
     model_id: int
     filename: pathlib.Path
@@ -88,7 +88,7 @@ class StorableObjectDataUpdateRequest:
     reference: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseStorableTask:
     model_id: int
     path: str
@@ -96,12 +96,12 @@ class BaseStorableTask:
     cad_type: CadType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateUpdateDataStorableTask(BaseStorableTask):
     reference: str
     filename: typing.Optional[pathlib.Path] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteStorableTask(BaseStorableTask):
     pass
@@ -23,26 +23,31 @@
 #
 from dataclasses import dataclass
 
+import types
 import typing
 
 from edaparts.models.components.component_model import ComponentModel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KiCadPartProperty:
     value: str
     visible: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KiCadPart:
     id: int
     name: str
     symbolIdStr: str
-    fields: dict[str, KiCadPartProperty]
+    fields: typing.Mapping[str, KiCadPartProperty]
 
+    def __post_init__(self):
+        # Read-only view of the fields, so parts can be safely shared
+        object.__setattr__(self, "fields", types.MappingProxyType(dict(self.fields)))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class KiCadCategoryEntry:
     id: int
     name: str
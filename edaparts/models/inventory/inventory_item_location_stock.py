@@ -23,7 +23,7 @@
 #
 
 
-from sqlalchemy import Column, Integer, ForeignKey, Float
+from sqlalchemy import Column, Integer, ForeignKey, Numeric
 from sqlalchemy.orm import relationship
 
 from edaparts.services.database import Base
@@ -33,17 +33,23 @@ class InventoryItemLocationStockModel(Base):
     __tablename__ = "inventory_item_location_stock"
 
     id = Column(Integer, primary_key=True)
-    actual_stock = Column(Float, nullable=False)  # todo: name typo
-    stock_min_level = Column(Float)
-    stock_notify_min_level = Column(Float)
+    # Stored as exact numerics, handled as floats by the application
+    # todo: name typo
+    actual_stock = Column(Numeric(14, 4, asdecimal=False), nullable=False)
+    stock_min_level = Column(Numeric(14, 4, asdecimal=False))
+    stock_notify_min_level = Column(Numeric(14, 4, asdecimal=False))
 
     # relationships
-    location_id = Column(Integer, ForeignKey("inventory_location.id"), nullable=False)
+    location_id = Column(
+        Integer, ForeignKey("inventory_location.id"), nullable=False, index=True
+    )
     location = relationship(
         "InventoryLocationModel", back_populates="stock_items", lazy="select"
     )
 
-    item_id = Column(Integer, ForeignKey("inventory_item.id"), nullable=False)
+    item_id = Column(
+        Integer, ForeignKey("inventory_item.id"), nullable=False, index=True
+    )
     item = relationship(
         "InventoryItemModel", back_populates="stock_items", lazy="select"
     )
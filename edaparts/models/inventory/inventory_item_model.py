@@ -23,7 +23,7 @@
 #
 
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from edaparts.models.inventory.inventory_identificable_item_model import (
@@ -34,19 +34,19 @@ from edaparts.models.inventory.inventory_identificable_item_model import (
 class InventoryItemModel(InventoryIdentificableItemModel):
     __tablename__ = "inventory_item"
     id = Column(Integer, primary_key=True)
-    mpn = Column(String(100), nullable=False, index=True)
+    mpn = Column(String(100), nullable=False)
     manufacturer = Column(String(100), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     description = Column(String(100))
-    last_buy_price = Column(Float)
+    last_buy_price = Column(Numeric(14, 4, asdecimal=False))
     dici = Column(String(70), nullable=False, index=True)
 
     # relationships
-    component_id = Column(Integer, ForeignKey("component.id"))
+    component_id = Column(Integer, ForeignKey("component.id"), index=True)
     component = relationship(
         "ComponentModel", back_populates="inventory_item", lazy="select"
     )
-    category_id = Column(Integer, ForeignKey("inventory_category.id"))
+    category_id = Column(Integer, ForeignKey("inventory_category.id"), index=True)
     category = relationship(
         "InventoryCategoryModel", back_populates="category_items", lazy="select"
     )
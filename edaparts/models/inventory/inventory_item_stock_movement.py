@@ -23,7 +23,7 @@
 #
 
 
-from sqlalchemy import Column, Integer, ForeignKey, Float, String, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, String, DateTime, func
 from sqlalchemy.orm import relationship
 
 from edaparts.services.database import Base
@@ -33,13 +33,16 @@ class InventoryItemLocationStockMovementModel(Base):
     __tablename__ = "inventory_item_location_stock_movement"
     id = Column(Integer, primary_key=True)
 
-    stock_change = Column(Float, nullable=False)
+    stock_change = Column(Numeric(14, 4, asdecimal=False), nullable=False)
     reason = Column(String(100), nullable=False)
     created_on = Column(DateTime(), server_default=func.now())
 
     # relationships
     stock_item_id = Column(
-        Integer, ForeignKey("inventory_item_location_stock.id"), nullable=False
+        Integer,
+        ForeignKey("inventory_item_location_stock.id"),
+        nullable=False,
+        index=True,
     )
     stock_item = relationship(
         "InventoryItemLocationStockModel", back_populates="stock_movements"
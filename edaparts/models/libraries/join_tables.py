@@ -23,19 +23,33 @@
 #
 
 
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Integer, ForeignKey, Index, Table
 from edaparts.services.database import Base
 
 component_footprint_asc_table = Table(
     "component_footprint_asc",
     Base.metadata,
-    Column("component_id", Integer, ForeignKey("component.id"), nullable=False),
-    Column("footprint_ref_id", Integer, ForeignKey("footprint_ref.id"), nullable=False),
+    Column("component_id", Integer, ForeignKey("component.id"), primary_key=True),
+    Column(
+        "footprint_ref_id", Integer, ForeignKey("footprint_ref.id"), primary_key=True
+    ),
+    # Covers reference to components lookups, the PK covers the other way
+    Index(
+        "ix_component_footprint_asc_footprint_ref_id_component_id",
+        "footprint_ref_id",
+        "component_id",
+    ),
 )
 
 component_library_asc_table = Table(
     "component_library_asc",
     Base.metadata,
-    Column("component_id", Integer, ForeignKey("component.id"), nullable=False),
-    Column("library_ref_id", Integer, ForeignKey("library_ref.id"), nullable=False),
+    Column("component_id", Integer, ForeignKey("component.id"), primary_key=True),
+    Column("library_ref_id", Integer, ForeignKey("library_ref.id"), primary_key=True),
+    # Covers reference to components lookups, the PK covers the other way
+    Index(
+        "ix_component_library_asc_library_ref_id_component_id",
+        "library_ref_id",
+        "component_id",
+    ),
 )
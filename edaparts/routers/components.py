@@ -30,6 +30,7 @@ import edaparts.services.component_service
 from edaparts.dtos.symbols_dtos import SymbolQueryDto, SymbolsComponentReferenceDto
 from edaparts.dtos.components_dtos import (
     ComponentCreateRequestDto,
+    ComponentsBatchCreateRequestDto,
     ComponentSpecificQueryDto,
     ComponentsListResultDto,
     ComponentUpdateRequestDto,
@@ -40,13 +41,15 @@ from edaparts.dtos.footprints_dtos import (
     FootprintQueryDto,
 )
 from edaparts.services.database import get_db
+from edaparts.utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/components", tags=["components"])
 
 
 @router.post("")
 async def create_component(
-    body: ComponentCreateRequestDto, db: AsyncSession = Depends(get_db)
+    body: ComponentCreateRequestDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> ComponentSpecificQueryDto:
     mapped_model = body.component.to_model()
     component = await edaparts.services.component_service.create_component(
@@ -55,11 +58,22 @@ async def create_component(
     return map_component_model_to_query_dto(component)
 
 
+@router.post("/batch")
+async def create_components(
+    body: ComponentsBatchCreateRequestDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> list[ComponentSpecificQueryDto]:
+    components = await edaparts.services.component_service.create_components(
+        db, [component.to_model() for component in body.components]
+    )
+    return [map_component_model_to_query_dto(component) for component in components]
+
+
 @router.put("/{component_id}")
 async def update_component(
     component_id: int,
     body: ComponentUpdateRequestDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> ComponentSpecificQueryDto:
     mapped_model = body.component.to_model()
     component = await edaparts.services.component_service.update_component(
@@ -68,26 +82,32 @@ async def update_component(
     return map_component_model_to_query_dto(component)
 
 
-@router.get("")
+@router.get("", response_model=ComponentsListResultDto)
 async def list_components(
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
-    db: AsyncSession = Depends(get_db),
-) -> ComponentsListResultDto:
+    cursor: Annotated[int | None, Query(gt=0)] = None,
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> PydanticJSONResponse:
     results, total_count = await edaparts.services.component_service.get_component_list(
-        db, page_n, page_size
+        db, page_n, page_size, cursor=cursor
     )
-    return ComponentsListResultDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[map_component_model_to_query_dto(m) for m in results],
+    return PydanticJSONResponse(
+        ComponentsListResultDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=total_count,
+            elements=[map_component_model_to_query_dto(m) for m in results],
+            # Components are listed by descending id, the last one is where the
+            # next page starts
+            next_cursor=results[-1].id if len(results) == page_size else None,
+        )
     )
 
 
 @router.get("/{component_id}")
 async def get_component(
-    component_id: int, db: AsyncSession = Depends(get_db)
+    component_id: int, db: AsyncSession = Depends(get_db, scope="function")
 ) -> ComponentSpecificQueryDto:
     result = await edaparts.services.component_service.get_component(db, component_id)
     return map_component_model_to_query_dto(result)
@@ -95,16 +115,17 @@ async def get_component(
 
 @router.delete("/{component_id}", status_code=204, response_class=Response)
 async def delete_component(
-    component_id: int, db: AsyncSession = Depends(get_db)
-) -> None:
+    component_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> Response:
     await edaparts.services.component_service.delete_component(db, component_id)
+    return Response(status_code=204)
 
 
 @router.post("/{component_id}/footprints")
 async def create_footprints_relations(
     component_id: int,
     body: FootprintsComponentReferenceDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> FootprintsComponentReferenceDto:
     footprints_ids = (
         await edaparts.services.component_service.create_footprints_relation(
@@ -120,16 +141,19 @@ async def create_footprints_relations(
     response_class=Response,
 )
 async def delete_footprint_relations(
-    component_id: int, footprint_id: int, db: AsyncSession = Depends(get_db)
-) -> None:
+    component_id: int,
+    footprint_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.component_service.delete_component_footprint_relation(
         db, component_id, footprint_id
     )
+    return Response(status_code=204)
 
 
 @router.get("/{component_id}/footprints")
 async def list_component_footprints(
-    component_id: int, db: AsyncSession = Depends(get_db)
+    component_id: int, db: AsyncSession = Depends(get_db, scope="function")
 ) -> list[FootprintQueryDto]:
 
     footprint_models = (
@@ -144,7 +168,7 @@ async def list_component_footprints(
 async def create_symbols_relations(
     component_id: int,
     body: SymbolsComponentReferenceDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolsComponentReferenceDto:
     symbol_ids = await edaparts.services.component_service.create_symbol_relation(
         db, component_id, body.symbol_ids
@@ -154,7 +178,7 @@ async def create_symbols_relations(
 
 @router.get("/{component_id}/symbols")
 async def list_component_symbols(
-    component_id: int, db: AsyncSession = Depends(get_db)
+    component_id: int, db: AsyncSession = Depends(get_db, scope="function")
 ) -> list[SymbolQueryDto]:
     symbol_models = (
         await edaparts.services.component_service.get_component_symbol_relations(
@@ -168,8 +192,11 @@ async def list_component_symbols(
     "/{component_id}/symbols/{symbol_id}", status_code=204, response_class=Response
 )
 async def delete_symbol_relations(
-    component_id: int, symbol_id: int, db: AsyncSession = Depends(get_db)
-) -> None:
+    component_id: int,
+    symbol_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.component_service.delete_component_symbol_relation(
         db, component_id, symbol_id
     )
+    return Response(status_code=204)
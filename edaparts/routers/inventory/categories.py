@@ -30,7 +30,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 
 import edaparts.services.inventory_service
-from edaparts.dtos.components_dtos import map_component_model_to_query_dto
 from edaparts.dtos.inventory_dtos import (
     InventoryCategoryCreateUpdateRequestDto,
     InventoryCategoryQueryDto,
@@ -40,13 +39,15 @@ from edaparts.dtos.inventory_dtos import (
     InventoryItemsQueryDto,
 )
 from edaparts.services.database import get_db
+from edaparts.utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/categories", tags=["inventory", "categories"])
 
 
 @router.post("")
 async def create_category(
-    body: InventoryCategoryCreateUpdateRequestDto, db: AsyncSession = Depends(get_db)
+    body: InventoryCategoryCreateUpdateRequestDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryCategoryQueryDto:
     category = await edaparts.services.inventory_service.create_category(
         db, body.name, description=body.description
@@ -58,7 +59,7 @@ async def create_category(
 async def update_category(
     category_id: int,
     body: InventoryCategoryCreateUpdateRequestDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryCategoryQueryDto:
     category = await edaparts.services.inventory_service.update_category(
         db, category_id, body.name, description=body.description
@@ -69,7 +70,7 @@ async def update_category(
 @router.get("/{category_id}")
 async def get_category(
     category_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryCategoryQueryDto:
     category = await edaparts.services.inventory_service.get_category(db, category_id)
     return InventoryCategoryQueryDto.from_model(category)
@@ -79,7 +80,7 @@ async def get_category(
 async def set_parent_category(
     body: InventoryCategoryReferenceCreationUpdateDto,
     category_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryCategoryQueryDto:
     category = await edaparts.services.inventory_service.set_category_parent(
         db, category_id, body.category_id
@@ -90,55 +91,50 @@ async def set_parent_category(
 @router.delete("/{category_id}/parent", status_code=204, response_class=Response)
 async def delete_parent_category(
     category_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> None:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.inventory_service.remove_category_parent(db, category_id)
+    return Response(status_code=204)
 
 
-@router.get("")
+@router.get("", response_model=InventoryCategoriesQueryDto)
 async def list_categories(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     only_root: bool | None = False,
-) -> InventoryCategoriesQueryDto:
+    cursor: Annotated[int | None, Query(gt=0)] = None,
+) -> PydanticJSONResponse:
     categories, total_count = await edaparts.services.inventory_service.get_categories(
-        db, page_n, page_size, only_root=only_root
+        db, page_n, page_size, only_root=only_root, cursor=cursor
     )
-    return InventoryCategoriesQueryDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[InventoryCategoryQueryDto.from_model(m) for m in categories],
+    return PydanticJSONResponse(
+        InventoryCategoriesQueryDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=total_count,
+            # Validated from the models attributes in a single pass
+            elements=categories,
+            next_cursor=categories[-1].id if len(categories) == page_size else None,
+        )
     )
 
 
-@router.get("/{category_id}/items")
+@router.get("/{category_id}/items", response_model=InventoryItemsQueryDto)
 async def list_category_items(
     category_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     include_component: bool | None = False,
-) -> InventoryItemsQueryDto:
+) -> PydanticJSONResponse:
     results, total_count = await edaparts.services.inventory_service.get_category_items(
         db, category_id, page_n, page_size, load_component=include_component
     )
-    dtos = [
-        InventoryItemQueryDto.from_model(
-            item_model,
-            component_dto=(
-                map_component_model_to_query_dto(item_model.component)
-                if include_component and item_model.component
-                else None
-            ),
-        )
-        for item_model in results
-    ]
     page_dto = InventoryItemsQueryDto(
         page_size=page_size,
         page_number=page_n,
         total_elements=total_count,
-        elements=dtos,
+        elements=InventoryItemQueryDto.from_models(results, include_component),
     )
-    return page_dto
+    return PydanticJSONResponse(page_dto)
@@ -23,7 +23,6 @@
 #
 
 
-import copy
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Response
@@ -31,7 +30,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 import edaparts.services.inventory_service
-from edaparts.dtos.components_dtos import map_component_model_to_query_dto
 from edaparts.dtos.inventory_dtos import (
     InventoryItemQueryDto,
     InventoryItemsQueryDto,
@@ -46,13 +44,17 @@ from edaparts.dtos.inventory_dtos import (
 )
 from edaparts.services import search_service
 from edaparts.services.database import get_db
+from edaparts.utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/items")
 
+__list_items_non_filter_params = frozenset(("page_n", "page_size", "include_component"))
+
 
 @router.post("", tags=["inventory", "items"])
 async def create_item(
-    body: InventoryItemCreateRequestDto, db: AsyncSession = Depends(get_db)
+    body: InventoryItemCreateRequestDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemQueryDto:
     item_model = await edaparts.services.inventory_service.create_standalone_item(
         db, InventoryItemCreateRequestDto.to_model(body)
@@ -60,22 +62,19 @@ async def create_item(
     return InventoryItemQueryDto.from_model(item_model)
 
 
-@router.get("/{item_id}", tags=["inventory", "items"])
+@router.get(
+    "/{item_id}", tags=["inventory", "items"], response_model=InventoryItemQueryDto
+)
 async def get_item(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     include_component: bool | None = False,
-) -> InventoryItemQueryDto:
+) -> PydanticJSONResponse:
     result = await edaparts.services.inventory_service.get_item(
         db, item_id, load_component=include_component
     )
-    return InventoryItemQueryDto.from_model(
-        result,
-        (
-            map_component_model_to_query_dto(result.component)
-            if include_component and result.component
-            else None
-        ),
+    return PydanticJSONResponse(
+        InventoryItemQueryDto.from_model(result, include_component)
     )
 
 
@@ -85,50 +84,43 @@ async def get_item(
     status_code=204,
     response_class=Response,
 )
-async def delete_item(item_id: int, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_item(
+    item_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> Response:
     await edaparts.services.inventory_service.delete_item(db, item_id)
+    return Response(status_code=204)
 
 
-@router.get("", tags=["inventory", "items"])
+@router.get("", tags=["inventory", "items"], response_model=InventoryItemsQueryDto)
 async def list_items(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
     include_component: bool | None = False,
-) -> InventoryItemsQueryDto:
-    filters = copy.deepcopy(dict(request.query_params))
-    filters.pop("page_n", None)
-    filters.pop("page_size", None)
-    filters.pop("include_component", None)
+) -> PydanticJSONResponse:
+    filters = {
+        key: value
+        for key, value in request.query_params.items()
+        if key not in __list_items_non_filter_params
+    }
     results, total_count = await search_service.search_items(
         db, filters, page_n, page_size, load_component=include_component
     )
-    dtos = [
-        InventoryItemQueryDto.from_model(
-            item_model,
-            component_dto=(
-                map_component_model_to_query_dto(item_model.component)
-                if include_component and item_model.component
-                else None
-            ),
-        )
-        for item_model in results
-    ]
     page_dto = InventoryItemsQueryDto(
         page_size=page_size,
         page_number=page_n,
         total_elements=total_count,
-        elements=dtos,
+        elements=InventoryItemQueryDto.from_models(results, include_component),
     )
-    return page_dto
+    return PydanticJSONResponse(page_dto)
 
 
 @router.post("/{item_id}/properties", tags=["inventory", "items", "properties"])
 async def create_item_property(
     item_id: int,
     body: InventoryItemPropertyCreateRequestDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemPropertyQueryDto:
     item_model = await edaparts.services.inventory_service.add_property_to_item(
         db, item_id, InventoryItemPropertyCreateRequestDto.to_model(body)
@@ -136,17 +128,21 @@ async def create_item_property(
     return InventoryItemPropertyQueryDto.from_model(item_model)
 
 
-@router.get("/{item_id}/properties", tags=["inventory", "items", "properties"])
+@router.get(
+    "/{item_id}/properties",
+    tags=["inventory", "items", "properties"],
+    response_model=list[InventoryItemPropertyQueryDto],
+)
 async def list_item_properties(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> list[InventoryItemPropertyQueryDto]:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> PydanticJSONResponse:
     item_properties = await edaparts.services.inventory_service.get_item_properties(
         db, item_id
     )
-    return [
-        InventoryItemPropertyQueryDto.from_model(model) for model in item_properties
-    ]
+    return PydanticJSONResponse(
+        [InventoryItemPropertyQueryDto.from_model(model) for model in item_properties]
+    )
 
 
 @router.put(
@@ -156,7 +152,7 @@ async def update_item_property(
     item_id: int,
     property_id: int,
     body: InventoryItemPropertyUpdateDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemPropertyQueryDto:
     item_model = await edaparts.services.inventory_service.update_item_property(
         db, item_id, property_id, body.value
@@ -173,11 +169,12 @@ async def update_item_property(
 async def delete_item_property(
     item_id: int,
     property_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> None:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.inventory_service.delete_item_property(
         db, item_id, property_id
     )
+    return Response(status_code=204)
 
 
 @router.post(
@@ -189,11 +186,12 @@ async def delete_item_property(
 async def set_item_category(
     item_id: int,
     body: InventoryCategoryReferenceCreationUpdateDto,
-    db: AsyncSession = Depends(get_db),
-) -> None:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.inventory_service.set_item_category(
         db, item_id, body.category_id
     )
+    return Response(status_code=204)
 
 
 @router.delete(
@@ -204,16 +202,17 @@ async def set_item_category(
 )
 async def delete_item_category(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> None:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     await edaparts.services.inventory_service.delete_item_category(db, item_id)
+    return Response(status_code=204)
 
 
 @router.post("/{item_id}/locations", tags=["inventory", "items", "locations"])
 async def set_item_locations(
     item_id: int,
     body: InventoryItemLocationReferenceDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemLocationReferenceDto:
     location_ids = (
         await edaparts.services.inventory_service.create_item_stocks_for_locations(
@@ -230,7 +229,7 @@ async def update_stock_item_location(
     item_id: int,
     location_id: int,
     body: InventoryItemLocationStockUpdateResourceDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemLocationStockQueryDto:
     item_location_stock = (
         await edaparts.services.inventory_service.update_item_location_stock_levels(
@@ -250,7 +249,7 @@ async def update_stock_item_location(
 async def get_stock_item_location(
     item_id: int,
     location_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryItemLocationStockQueryDto:
     item_location_stock = (
         await edaparts.services.inventory_service.get_item_stock_for_location(
@@ -35,13 +35,15 @@ from edaparts.dtos.inventory_dtos import (
     InventoryLocationCreateDto,
 )
 from edaparts.services.database import get_db
+from edaparts.utils.responses import PydanticJSONResponse
 
 router = APIRouter()
 
 
 @router.post("/locations", tags=["inventory", "locations"])
 async def create_location(
-    body: InventoryLocationCreateDto, db: AsyncSession = Depends(get_db)
+    body: InventoryLocationCreateDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryLocationQueryDto:
     location = await edaparts.services.inventory_service.create_location(
         db, body.name, description=body.description
@@ -49,20 +51,27 @@ async def create_location(
     return InventoryLocationQueryDto.from_model(location)
 
 
-@router.get("/locations", tags=["inventory", "locations"])
+@router.get(
+    "/locations",
+    tags=["inventory", "locations"],
+    response_model=InventoryLocationsQueryDto,
+)
 async def list_locations(
     page_n: Annotated[int | None, Query(gt=0)] = 1,
     page_size: Annotated[int | None, Query(gt=0)] = 20,
-    db: AsyncSession = Depends(get_db),
-) -> InventoryLocationsQueryDto:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> PydanticJSONResponse:
     results, total_count = await edaparts.services.inventory_service.get_locations(
         db, page_n, page_size
     )
-    return InventoryLocationsQueryDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[InventoryLocationQueryDto.from_model(m) for m in results],
+    return PydanticJSONResponse(
+        InventoryLocationsQueryDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=total_count,
+            # Validated from the models attributes in a single pass
+            elements=results,
+        )
     )
 
 
@@ -72,13 +81,20 @@ async def list_locations(
     status_code=204,
     response_class=Response,
 )
-async def delete_location(location_id: int, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_location(
+    location_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> Response:
     await edaparts.services.inventory_service.delete_stock_location(db, location_id)
+    return Response(status_code=204)
 
 
-@router.get("/locations/{location_id}", tags=["inventory", "locations"])
+@router.get(
+    "/locations/{location_id}",
+    tags=["inventory", "locations"],
+    response_model=InventoryLocationQueryDto,
+)
 async def get_location(
-    location_id: int, db: AsyncSession = Depends(get_db)
-) -> InventoryLocationQueryDto:
+    location_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> PydanticJSONResponse:
     result = await edaparts.services.inventory_service.get_location(db, location_id)
-    return InventoryLocationQueryDto.from_model(result)
+    return PydanticJSONResponse(InventoryLocationQueryDto.from_model(result))
@@ -38,7 +38,8 @@ router = APIRouter(prefix="/stocks", tags=["inventory", "stocks"])
 
 @router.post("/updates", tags=["inventory", "locations"])
 async def stock_mass_update(
-    body: InventoryMassStockMovementDto, db: AsyncSession = Depends(get_db)
+    body: InventoryMassStockMovementDto,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> InventoryMassStockMovementQueryDto:
     update_results = await edaparts.services.inventory_service.stock_mass_update(
         db, InventoryMassStockMovementDto.to_model(body)
@@ -28,7 +28,7 @@ import typing
 from fastapi import APIRouter, UploadFile, Form, BackgroundTasks
 from fastapi.params import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import FileResponse
+from starlette.responses import Response
 
 import edaparts.services.storable_objects_service
 from edaparts.dtos.libraries_dtos import (
@@ -44,6 +44,7 @@ from edaparts.models.internal.internal_models import (
 )
 from edaparts.services.database import get_db
 from edaparts.utils.files import TempCopiedFile
+from edaparts.utils.responses import PydanticJSONResponse, model_file_response
 
 router = APIRouter(prefix="/symbols", tags=["symbols"])
 
@@ -56,9 +57,9 @@ async def create_upload_file(
     description: typing.Optional[str] = Form(None),
     path: str = Form(),
     cad_type: LibraryTypeEnum = Form(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolQueryDto:
-    with TempCopiedFile(file.file) as disk_file:
+    async with TempCopiedFile(file.file) as disk_file:
         library_model = await edaparts.services.storable_objects_service.create_storable_library_object(
             db,
             background_tasks,
@@ -78,7 +79,7 @@ async def create_upload_file(
 async def create_from_existing_path(
     background_tasks: BackgroundTasks,
     body: CommonObjectFromExistingCreateDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolQueryDto:
     library_model = await edaparts.services.storable_objects_service.create_storable_library_object_from_existing_file(
         db,
@@ -94,9 +95,9 @@ async def update_upload_file(
     model_id: int,
     file: UploadFile,
     reference: typing.Optional[str] = Form(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolQueryDto:
-    with TempCopiedFile(file.file) as disk_file:
+    async with TempCopiedFile(file.file) as disk_file:
         library_model = (
             await edaparts.services.storable_objects_service.update_object_data(
                 db,
@@ -115,19 +116,7 @@ async def update_upload_file(
 @router.get("/{model_id}")
 async def get_symbol(
     model_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> SymbolQueryDto:
-
-    symbol = await edaparts.services.storable_objects_service.get_storable_model(
-        db, StorableLibraryResourceType.SYMBOL, model_id
-    )
-    return SymbolQueryDto.from_model(symbol)
-
-
-@router.get("/{model_id}")
-async def update_symbol(
-    model_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolQueryDto:
 
     symbol = await edaparts.services.storable_objects_service.get_storable_model(
@@ -141,7 +130,7 @@ async def update_symbol(
     background_tasks: BackgroundTasks,
     model_id: int,
     body: CommonObjectUpdateDto,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> SymbolQueryDto:
 
     result = await edaparts.services.storable_objects_service.update_object_metadata(
@@ -156,30 +145,34 @@ async def update_symbol(
 @router.get("/{model_id}/data")
 async def get_symbol_data(
     model_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> FileResponse:
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> Response:
     path = (
         await edaparts.services.storable_objects_service.get_storable_model_data_path(
             db, StorableLibraryResourceType.SYMBOL, model_id
         )
     )
-    return FileResponse(path=path)
+    return model_file_response(path)
 
 
-@router.get("")
+@router.get("", response_model=SymbolListResultDto)
 async def list_symbols(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     page_n: typing.Annotated[int | None, Query(gt=0)] = 1,
     page_size: typing.Annotated[int | None, Query(gt=0)] = 20,
-) -> SymbolListResultDto:
+    cursor: typing.Annotated[int | None, Query(gt=0)] = None,
+) -> PydanticJSONResponse:
     results, total_count = (
         await edaparts.services.storable_objects_service.get_storable_objects(
-            db, StorableLibraryResourceType.SYMBOL, page_n, page_size
+            db, StorableLibraryResourceType.SYMBOL, page_n, page_size, cursor=cursor
         )
     )
-    return SymbolListResultDto(
-        page_size=page_size,
-        page_number=page_n,
-        total_elements=total_count,
-        elements=[SymbolQueryDto.from_model(m) for m in results],
+    return PydanticJSONResponse(
+        SymbolListResultDto(
+            page_size=page_size,
+            page_number=page_n,
+            total_elements=total_count,
+            elements=[SymbolQueryDto.from_model(m) for m in results],
+            next_cursor=results[-1].id if len(results) == page_size else None,
+        )
     )
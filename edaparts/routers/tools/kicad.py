@@ -22,10 +22,13 @@
 #  SOFTWARE.
 #
 
+import functools
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
+from starlette.responses import Response
 
 from edaparts.dtos.kicad_dtos import (
     CategoryQueryDto,
@@ -36,17 +39,30 @@ from edaparts.dtos.kicad_dtos import (
     PartQueryDto,
 )
 from edaparts.services.database import get_db
+from edaparts.utils.responses import PydanticJSONResponse
 import edaparts.services.kicad
 
 router = APIRouter(prefix="/tools/kicad", tags=["kicad"])
 
 
-@router.get("/api/v1/categories.json")
-async def list_categories() -> CategoriesQueryDto:
-    return [
-        CategoryQueryDto(id=str(elem.id), name=elem.name)
-        for elem in edaparts.services.kicad.get_components_categories().values()
-    ]
+@functools.cache
+def __get_categories_json() -> bytes:
+    # The categories are the component types, they never change while running
+    return TypeAdapter(CategoriesQueryDto).dump_json(
+        [
+            CategoryQueryDto(id=str(elem.id), name=elem.name)
+            for elem in edaparts.services.kicad.get_components_categories().values()
+        ]
+    )
+
+
+@router.get("/api/v1/categories.json", response_model=CategoriesQueryDto)
+async def list_categories() -> Response:
+    return Response(
+        content=__get_categories_json(),
+        media_type="application/json",
+        headers={"Cache-Control": "max-age=60"},
+    )
 
 
 @router.get("/api/v1/")
@@ -57,15 +73,21 @@ async def endpoint_check(request: Request) -> EndpointsQueryDto:
     )
 
 
-@router.get("/api/v1/parts/category/{category_id}.json")
+@router.get(
+    "/api/v1/parts/category/{category_id}.json", response_model=CategoryPartsQueryDto
+)
 async def list_category_parts(
-    category_id: int, db: AsyncSession = Depends(get_db)
-) -> CategoryPartsQueryDto:
+    category_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> PydanticJSONResponse:
     results = await edaparts.services.kicad.get_components_for_category(db, category_id)
-    return [CategoryPartQueryDto.from_model(result) for result in results]
+    return PydanticJSONResponse(
+        [CategoryPartQueryDto.from_model(result) for result in results]
+    )
 
 
-@router.get("/api/v1/parts/{part_id}.json")
-async def get_part(part_id: int, db: AsyncSession = Depends(get_db)) -> PartQueryDto:
+@router.get("/api/v1/parts/{part_id}.json", response_model=PartQueryDto)
+async def get_part(
+    part_id: int, db: AsyncSession = Depends(get_db, scope="function")
+) -> PydanticJSONResponse:
     result = await edaparts.services.kicad.get_component(db, part_id)
-    return PartQueryDto.from_model(result)
+    return PydanticJSONResponse(PartQueryDto.from_model(result))
@@ -23,10 +23,13 @@
 #
 
 
+import functools
 import logging
 import typing
 
-from sqlalchemy import select, func, inspect, insert, delete
+from sqlalchemy import select, inspect, delete, tuple_, union, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -46,10 +49,34 @@ from edaparts.services.exceptions import (
     RelationExistsError,
 )
 from edaparts.utils.helpers import BraceMessage as __l
-from edaparts.utils.sqlalchemy import query_page
+from edaparts.utils.sqlalchemy import query_page, query_keyset_page, CountCache
 
 __logger = logging.getLogger(__name__)
 
+# Listing the components is unfiltered, so a single count serves every page
+__components_count_cache = CountCache(ttl=30)
+
+
+__component_reserved_field_names = frozenset(
+    ("created_on", "updated_on", "id", "mpn", "manufacturer")
+)
+
+
+@functools.cache
+def __get_component_updatable_fields(
+    model_type: type[ComponentModelType],
+) -> tuple[str, ...]:
+    # Only depends on the mapper, so it's computed once per component type
+    mapper = inspect(model_type)
+    to_map_fields = set(mapper.attrs.keys()) - __component_reserved_field_names
+    to_map_fields.discard("type")
+    # Compute the columns that are used for relationships and discard them
+    for name, data in mapper.relationships.items():
+        for relation_col in (col.key for col in data.local_columns):
+            to_map_fields.discard(relation_col)
+        to_map_fields.discard(name)
+    return tuple(name for name in mapper.attrs.keys() if name in to_map_fields)
+
 
 def __validate_update_component_model(
     model: ComponentModelType, candidate_model: ComponentModelType
@@ -59,47 +86,55 @@ def __validate_update_component_model(
             f"Component type cannot be changed. Existing component type: {model.type}",
             reserved_fields="type",
         )
-    reserved_field_names = ["created_on", "updated_on", "id", "mpn", "manufacturer"]
     candidate_inspect = inspect(candidate_model)
     present_fields = [
         data
         for name, data in candidate_inspect.attrs.items()
-        if name in reserved_field_names
+        if name in __component_reserved_field_names
     ]
     invalid_fields = [field for field in present_fields if field.value is not None]
     if invalid_fields:
         raise InvalidComponentFieldsError(
             "Update reserved fields were provided", reserved_fields=invalid_fields
         )
-    relationship_fields = candidate_inspect.mapper.relationships
-    to_map_fields = set(candidate_inspect.attrs.keys()) - set(
-        reserved_field_names + ["type"]
-    )
-    # Compute the columns that are used for relationships and discard them
-    for name, data in relationship_fields.items():
-        for relation_col in (col.key for col in data.local_columns):
-            to_map_fields.discard(relation_col)
-        to_map_fields.discard(name)
 
     # Update the fields in the target model
-    for name, attr in candidate_inspect.attrs.items():
-        if name not in to_map_fields:
-            continue
+    for name in __get_component_updatable_fields(type(candidate_model)):
         setattr(model, name, getattr(candidate_model, name))
 
 
+async def __ensure_component_exists(db: AsyncSession, component_id: int):
+    # Only the id is queried, from the base table. Going through the mapper,
+    # even for a single column, joins all the component type tables
+    component_table = ComponentModel.__table__
+    exists_id = (
+        await db.scalars(
+            select(component_table.c.id)
+            .where(component_table.c.id == component_id)
+            .limit(1)
+        )
+    ).first()
+    if not exists_id:
+        raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
+
+
 async def create_component[T: ComponentModelType](db: AsyncSession, model: T) -> T:
-    __logger.debug(
-        __l(
-            "Creating component [mpn={0}, manufacturer={1}]",
-            model.mpn,
-            model.manufacturer,
+    return (await create_components(db, [model]))[0]
+
+
+async def create_components[T: ComponentModelType](
+    db: AsyncSession, models: typing.Sequence[T]
+) -> typing.Sequence[T]:
+    keys = [(model.mpn, model.manufacturer) for model in models]
+    __logger.debug(__l("Creating components [mpn_manufacturer={0}]", keys))
+    if len(set(keys)) != len(keys):
+        raise ResourceAlreadyExistsApiError(
+            "Cannot create the requested components cause some are repeated"
         )
-    )
     exists_id = (
         await db.scalars(
             select(ComponentModel.id)
-            .filter_by(mpn=model.mpn, manufacturer=model.manufacturer)
+            .where(tuple_(ComponentModel.mpn, ComponentModel.manufacturer).in_(keys))
             .limit(1)
         )
     ).first()
@@ -109,17 +144,30 @@ async def create_component[T: ComponentModelType](db: AsyncSession, model: T) ->
             conflicting_id=exists_id,
         )
     try:
-        db.add(model)
-
-        # Create inventory item automatically
-        await inventory_service.create_item_for_component(db, model)
+        db.add_all(models)
+        # A single flush lets the unit of work insert the rows of each table
+        # in batches, instead of a round-trip per component
+        await db.flush()
+
+        # Create inventory items automatically. Don't autoflush them one by
+        # one while their identifiers are generated, the commit sends them
+        # all together. The identifiers of the batch are checked apart, as
+        # the DB doesn't see them until then
+        batch_dicis = set()
+        with db.no_autoflush:
+            for model in models:
+                item = await inventory_service.create_item_for_component(
+                    db, model, taken_dicis=batch_dicis
+                )
+                batch_dicis.add(item.dici)
         await db.commit()
 
     except:
         await db.rollback()
         raise
-    __logger.debug(__l("Component created [id={0}]", model.id))
-    return model
+    __components_count_cache.invalidate()
+    __logger.debug(__l("Components created [ids={0}]", [model.id for model in models]))
+    return models
 
 
 async def update_component(
@@ -141,14 +189,77 @@ async def update_component(
         )
     )
 
-    # refresh required to load update_on changes after commiting
-    await db.refresh(current_model)
+    # No refresh needed, updated_on comes back with the UPDATE (eager_defaults)
     return current_model
 
 
+async def __create_component_references(
+    db: AsyncSession,
+    component_id: int,
+    reference_ids: list[int],
+    asc_table: Table,
+    reference_model: type[LibraryReference] | type[FootprintReference],
+    not_found_message: str,
+) -> list[int]:
+    asc_reference_column = next(
+        column for column in asc_table.c if column.key != "component_id"
+    )
+    reference_ids = list(dict.fromkeys(reference_ids))
+    current_ids = select(asc_reference_column).where(
+        asc_table.c.component_id == component_id
+    )
+    if reference_ids:
+        # Insert and read back in a single statement. Existing pairs are
+        # skipped by the primary key and the inserted ones are added to the
+        # result apart, as the statement snapshot doesn't see them yet
+        inserted = (
+            postgresql.insert(asc_table)
+            .values(
+                [
+                    {"component_id": component_id, asc_reference_column.key: ref_id}
+                    for ref_id in reference_ids
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(asc_reference_column)
+            .cte("inserted")
+        )
+        current_ids = union(current_ids, select(inserted.c[asc_reference_column.key]))
+    else:
+        await __ensure_component_exists(db, component_id)
+
+    try:
+        result_ids = (await db.scalars(current_ids)).all()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # Only a missing component or reference can break the foreign keys.
+        # Look for it now, the lookups are not paid when everything exists
+        await __ensure_component_exists(db, component_id)
+        found_ids = set(
+            (
+                await db.scalars(
+                    select(reference_model.id).where(
+                        reference_model.id.in_(reference_ids)
+                    )
+                )
+            ).all()
+        )
+        for ref_id in reference_ids:
+            if ref_id not in found_ids:
+                raise ResourceNotFoundApiError(not_found_message, missing_id=ref_id)
+        # Everything exists, so the relations changed concurrently. Report it
+        # as a conflict instead of leaking the DB error
+        raise ResourceAlreadyExistsApiError(
+            "The component relations were modified concurrently",
+            conflicting_id=component_id,
+        )
+    return sorted(result_ids)
+
+
 async def create_symbol_relation(
     db: AsyncSession, component_id: int, symbol_ids: list[int]
-):
+) -> list[int]:
     __logger.debug(
         __l(
             "Creating new component-symbol relation [component_id={0}, symbol_ids={1}]",
@@ -156,43 +267,14 @@ async def create_symbol_relation(
             symbol_ids,
         )
     )
-
-    component = await db.get(ComponentModel, component_id)
-    if not component:
-        raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
-
-    # Use the many-to-many table directly instead of ORM relation to avoid
-    # the slow load of the SQL query that joins all component tables
-    existing_library_ids = list(
-        (
-            await db.scalars(
-                select(component_library_asc_table.c.library_ref_id).filter(
-                    component_library_asc_table.c.component_id == component_id
-                )
-            )
-        ).fetchall()
+    library_ids = await __create_component_references(
+        db,
+        component_id,
+        symbol_ids,
+        component_library_asc_table,
+        LibraryReference,
+        "Symbol not found",
     )
-
-    # Add only the symbols that are not already associated
-    library_ids_to_add = [
-        library_id
-        for library_id in symbol_ids
-        if library_id not in existing_library_ids
-    ]
-    if not library_ids_to_add:
-        return sorted(library_ids_to_add)
-
-    symbol_refs = []
-    for symbol_id in library_ids_to_add:
-        symbol_ref = await db.get(LibraryReference, symbol_id)
-        if not symbol_ref:
-            raise ResourceNotFoundApiError("Symbol not found", missing_id=symbol_id)
-        symbol_refs.append(
-            {"library_ref_id": symbol_ref.id, "component_id": component_id}
-        )
-
-    await db.execute(insert(component_library_asc_table), symbol_refs)
-    await db.commit()
     __logger.debug(
         __l(
             "Component symbols updated [component_id={0}, symbol_ids={1}",
@@ -200,7 +282,7 @@ async def create_symbol_relation(
             symbol_ids,
         )
     )
-    return list(sorted(dict.fromkeys(existing_library_ids + library_ids_to_add)))
+    return library_ids
 
 
 async def create_footprints_relation(
@@ -213,43 +295,14 @@ async def create_footprints_relation(
             footprint_ids,
         )
     )
-
-    component = await db.get(ComponentModel, component_id)
-    if not component:
-        raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
-
-    # Use the many-to-many table directly instead of ORM relation to avoid
-    # the slow load of the SQL query that joins all component tables
-    existing_footprints_ids = list(
-        (
-            await db.scalars(
-                select(component_footprint_asc_table.c.footprint_ref_id).filter(
-                    component_footprint_asc_table.c.component_id == component_id
-                )
-            )
-        ).fetchall()
+    footprints_ids = await __create_component_references(
+        db,
+        component_id,
+        footprint_ids,
+        component_footprint_asc_table,
+        FootprintReference,
+        "Footprint not found",
     )
-
-    # Add only the footprints that are not already associated
-    footprints_to_add = [
-        foot_id for foot_id in footprint_ids if foot_id not in existing_footprints_ids
-    ]
-    if not footprints_to_add:
-        return sorted(existing_footprints_ids)
-
-    footprint_refs = []
-    for footprint_id in footprints_to_add:
-        footprint_ref = await db.get(FootprintReference, footprint_id)
-        if not footprint_ref:
-            raise ResourceNotFoundApiError(
-                "Footprint not found", missing_id=footprint_id
-            )
-        footprint_refs.append(
-            {"footprint_ref_id": footprint_ref.id, "component_id": component_id}
-        )
-
-    await db.execute(insert(component_footprint_asc_table), footprint_refs)
-    await db.commit()
     __logger.debug(
         __l(
             "Component footprints updated [component_id={0}, footprint_ids={1}",
@@ -257,7 +310,7 @@ async def create_footprints_relation(
             footprint_ids,
         )
     )
-    return list(sorted(dict.fromkeys(existing_footprints_ids + footprints_to_add)))
+    return footprints_ids
 
 
 async def get_component_symbol_relations(
@@ -266,15 +319,17 @@ async def get_component_symbol_relations(
     __logger.debug(
         __l("Querying symbol relations for component [component_id={0}]", component_id)
     )
-    component = await db.get(ComponentModel, component_id)
-    if not component:
-        raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
+    await __ensure_component_exists(db, component_id)
 
+    # Straight from the association table, without joining the component
     return (
         await db.scalars(
             select(LibraryReference)
-            .join(LibraryReference.components_l)
-            .filter_by(id=component_id)
+            .join(
+                component_library_asc_table,
+                component_library_asc_table.c.library_ref_id == LibraryReference.id,
+            )
+            .where(component_library_asc_table.c.component_id == component_id)
         )
     ).all()
 
@@ -288,15 +343,18 @@ async def get_component_footprint_relations(
             component_id,
         )
     )
-    component = await db.get(ComponentModel, component_id)
-    if not component:
-        raise ResourceNotFoundApiError("Component not found", missing_id=component_id)
+    await __ensure_component_exists(db, component_id)
 
+    # Straight from the association table, without joining the component
     return (
         await db.scalars(
             select(FootprintReference)
-            .join(FootprintReference.components_f)
-            .filter_by(id=component_id)
+            .join(
+                component_footprint_asc_table,
+                component_footprint_asc_table.c.footprint_ref_id
+                == FootprintReference.id,
+            )
+            .where(component_footprint_asc_table.c.component_id == component_id)
         )
     ).all()
 
@@ -310,23 +368,36 @@ async def get_component(db: AsyncSession, component_id: int) -> ComponentModel:
 
 
 async def get_component_list(
-    db: AsyncSession, page_number: int, page_size: int
+    db: AsyncSession, page_number: int, page_size: int, cursor: int | None = None
 ) -> typing.Tuple[typing.Sequence[ComponentModel], int]:
     __logger.debug(
         __l(
-            "Listing components for [page_number={0}, page_size={1}]",
+            "Listing components for [page_number={0}, page_size={1}, cursor={2}]",
             page_number,
             page_size,
+            cursor,
         )
     )
 
-    query = (
-        select(ComponentModel)
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
-        .order_by(ComponentModel.id.desc())
+    query = select(ComponentModel).limit(page_size).order_by(ComponentModel.id.desc())
+    if cursor is None:
+        return await query_page(
+            db,
+            query.offset((page_number - 1) * page_size),
+            count_cache=__components_count_cache,
+        )
+
+    # Keyset pagination: resume right after the last id the caller got, so the
+    # cost of a page doesn't depend on how deep it is. The total is counted on
+    # the base table only, without the subtype joins
+    return await query_keyset_page(
+        db,
+        query,
+        ComponentModel.id,
+        cursor,
+        count_cache=__components_count_cache,
+        count_from=ComponentModel.__table__,
     )
-    return await query_page(db, query)
 
 
 async def delete_component(db: AsyncSession, component_id: int):
@@ -346,6 +417,7 @@ async def delete_component(db: AsyncSession, component_id: int):
 
         await db.delete(component)
         await db.commit()
+        __components_count_cache.invalidate()
         __logger.debug(__l("Deleted component [component_id={0}]", component_id))
 
 
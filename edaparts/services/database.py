@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 Base = declarative_base()
 
@@ -18,12 +19,48 @@ class DatabaseSessionManager:
         self._engine: AsyncEngine | None = None
         self._sessionmaker: async_sessionmaker | None = None
 
-    def init(self, host: str, echo=False) -> None:
-        self._engine = create_async_engine(host, echo=echo)
+    def init(
+        self,
+        host: str,
+        echo=False,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = 3600,
+        pool_pre_ping: bool = True,
+        disable_pool: bool = False,
+        prepare_threshold: int | None = 1,
+    ) -> None:
+        connect_args = {"prepare_threshold": prepare_threshold}
+        if disable_pool:
+            self._engine = create_async_engine(
+                host, echo=echo, poolclass=NullPool, connect_args=connect_args
+            )
+        else:
+            self._engine = create_async_engine(
+                host,
+                echo=echo,
+                connect_args=connect_args,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+            )
         self._sessionmaker = async_sessionmaker(
             autocommit=False, bind=self._engine, expire_on_commit=False
         )
 
+    async def warm_up(self, connections: int):
+        if self._engine is None:
+            raise Exception("DatabaseSessionManager is not initialized")
+
+        # All of them are held at the same time, so the pool has to open a new
+        # connection for each one. They are kept in the pool when released
+        async with contextlib.AsyncExitStack() as stack:
+            for _ in range(connections):
+                await stack.enter_async_context(self._engine.connect())
+
     async def close(self):
         if self._engine is None:
             raise Exception("DatabaseSessionManager is not initialized")
@@ -67,6 +104,10 @@ class DatabaseSessionManager:
 sessionmanager = DatabaseSessionManager()
 
 
+# Meant to be used with the "function" scope. The session, and its pooled
+# connection, are released as soon as the path operation returns, instead of
+# after the response is sent and the background tasks (which open their own
+# sessions) have run
 async def get_db():
     async with sessionmanager.session() as session:
         yield session
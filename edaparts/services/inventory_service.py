@@ -61,7 +61,7 @@ from edaparts.services.exceptions import (
     InvalidCategoryRelationError,
 )
 from edaparts.utils.helpers import BraceMessage as __l
-from edaparts.utils.sqlalchemy import query_page
+from edaparts.utils.sqlalchemy import query_page, query_keyset_page
 
 __logger = logging.getLogger(__name__)
 
@@ -190,7 +190,9 @@ def __recursive_parent_search(
 
 
 async def create_item_for_component(
-    db: AsyncSession, component_model: ComponentModel
+    db: AsyncSession,
+    component_model: ComponentModel,
+    taken_dicis: typing.Collection[str] = (),
 ) -> InventoryItemModel:
     exists_id = (
         await db.scalars(
@@ -206,7 +208,9 @@ async def create_item_for_component(
             msg="An item already exists for the given component",
             conflicting_id=exists_id,
         )
-    dici_id = await generate_item_id(db, obj_model=component_model)
+    dici_id = await generate_item_id(
+        db, obj_model=component_model, taken_dicis=taken_dicis
+    )
     item_model = InventoryItemModel(
         dici=dici_id,
         mpn=component_model.mpn,
@@ -348,8 +352,9 @@ async def get_category_items(
         raise ResourceNotFoundApiError("Category not found", missing_id=category_id)
 
     query = select(InventoryItemModel).filter_by(category_id=category_id)
+    # Loaded apart, see search_service.search_items
     query = (
-        query.options(joinedload(InventoryItemModel.component))
+        query.options(selectinload(InventoryItemModel.component))
         if load_component
         else query
     )
@@ -637,18 +642,22 @@ async def get_item_properties(
 ) -> list[InventoryItemPropertyModel]:
     __logger.debug(__l("Retrieving item properties [item_id={0}]", item_id))
 
-    query = (
-        select(InventoryItemModel)
-        .filter_by(id=item_id)
-        .options(selectinload(InventoryItemModel.item_properties))
-        .limit(1)
-    )
-    result = (await db.scalars(query)).first()
-
-    if not result:
-        raise ResourceNotFoundApiError("Item not found", missing_id=item_id)
+    # The properties are queried straight by their item id, covered by the
+    # item-name unique constraint. The item is only checked when there are
+    # none, to tell an item without properties from a missing one
+    item_properties = (
+        await db.scalars(select(InventoryItemPropertyModel).filter_by(item_id=item_id))
+    ).all()
+    if not item_properties:
+        db_item_id = (
+            await db.scalars(
+                select(InventoryItemModel.id).filter_by(id=item_id).limit(1)
+            )
+        ).first()
+        if not db_item_id:
+            raise ResourceNotFoundApiError("Item not found", missing_id=item_id)
 
-    return result.item_properties
+    return list(item_properties)
 
 
 async def delete_item_property(db: AsyncSession, item_id: int, property_id: int):
@@ -698,18 +707,20 @@ async def get_category(db: AsyncSession, category_id: int) -> InventoryCategoryM
 
 
 async def get_categories(
-    db: AsyncSession, page_number: int, page_size: int, only_root: bool = False
+    db: AsyncSession,
+    page_number: int,
+    page_size: int,
+    only_root: bool = False,
+    cursor: int | None = None,
 ) -> typing.Tuple[list[InventoryCategoryModel], int]:
     __logger.debug("Retrieving categories")
 
     query = select(InventoryCategoryModel)
     query = query.filter_by(parent_id=None) if only_root else query
-    query = (
-        query.order_by(InventoryCategoryModel.id.desc())
-        .limit(page_size)
-        .offset((page_number - 1) * page_size)
-    )
-    return await query_page(db, query)
+    query = query.order_by(InventoryCategoryModel.id.desc()).limit(page_size)
+    if cursor is not None:
+        return await query_keyset_page(db, query, InventoryCategoryModel.id, cursor)
+    return await query_page(db, query.offset((page_number - 1) * page_size))
 
 
 async def set_category_parent(
@@ -841,7 +852,9 @@ def __id_generator(size=10, chars=None) -> str:
     )
 
 
-async def generate_item_id(db: AsyncSession, obj_model=None):
+async def generate_item_id(
+    db: AsyncSession, obj_model=None, taken_dicis: typing.Collection[str] = ()
+):
     if isinstance(obj_model, InventoryIdentificableItemModel):
         query_obj = None
         if isinstance(obj_model, InventoryItemModel) or isinstance(
@@ -855,6 +868,9 @@ async def generate_item_id(db: AsyncSession, obj_model=None):
             model_prefix = obj_model.get_id_prefix()
             for x in range(3):
                 gen_dici = model_prefix + "-" + __id_generator()
+                # Identifiers given to pending objects aren't in the DB yet
+                if gen_dici in taken_dicis:
+                    continue
                 existing_dici_result = await db.scalars(
                     select(query_obj.dici).filter_by(dici=gen_dici).limit(1)
                 )
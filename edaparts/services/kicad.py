@@ -27,13 +27,14 @@ import logging
 import re
 import typing
 
-from sqlalchemy import inspect, select
+from sqlalchemy import inspect, select, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from edaparts.models import LibraryReference
 from edaparts.models.components.component_model import ComponentModel
 from edaparts.models.internal.internal_models import CadType
+from edaparts.models.libraries.join_tables import component_library_asc_table
 from edaparts.models.internal.kicad_models import (
     KiCadCategoryEntry,
     KiCadPart,
@@ -73,22 +74,40 @@ def get_components_categories() -> typing.Dict[int, KiCadCategoryEntry]:
 
 async def get_components_for_category(
     db: AsyncSession, category_id: int
-) -> typing.Sequence[ComponentModel]:
+) -> typing.Sequence[Row]:
     if category_id not in __components_types_dict:
         raise ResourceNotFoundApiError(
             f"Category {category_id} does not exist", missing_id=category_id
         )
     __logger.debug(__l("Listing components for [category_id={0}]", category_id))
 
+    # Only the listed columns, straight from the base table filtered by the
+    # type, instead of loading whole components. EXISTS keeps a component
+    # with more than one KiCad symbol from being listed once per symbol
+    component_table = ComponentModel.__table__
+    component_type = __components_types_dict[category_id].component_type
     query = (
-        select(__components_types_dict[category_id].component_type)
-        .join(ComponentModel.library_refs)
-        .where(LibraryReference.cad_type == CadType.KICAD)
-        .order_by(ComponentModel.id.desc())
+        select(
+            component_table.c.id,
+            component_table.c.mpn,
+            component_table.c.description,
+        )
+        .where(
+            component_table.c.type == component_type.__mapper__.polymorphic_identity,
+            select(component_library_asc_table.c.component_id)
+            .join(
+                LibraryReference,
+                LibraryReference.id == component_library_asc_table.c.library_ref_id,
+            )
+            .where(
+                component_library_asc_table.c.component_id == component_table.c.id,
+                LibraryReference.cad_type == CadType.KICAD,
+            )
+            .exists(),
+        )
+        .order_by(component_table.c.id.desc())
     )
-    result_page = await db.scalars(query)
-
-    return result_page.fetchall()
+    return (await db.execute(query)).all()
 
 
 async def get_component(db: AsyncSession, component_id: int) -> KiCadPart:
@@ -25,8 +25,9 @@ import typing
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
+from edaparts.models.components import COMPONENT_MODELS_BY_IDENTITY
 from edaparts.models.components.component_model import ComponentModel
 from edaparts.models.inventory.inventory_item_model import InventoryItemModel
 from edaparts.models.inventory.inventory_item_property import InventoryItemPropertyModel
@@ -274,24 +275,22 @@ async def search_items(
 
     # Apply component model filters
     if any(filt.startswith("comp_") for filt in search_filters.keys()):
-        # An specific component type has been provided
-        if "comp_type_eq" in search_filters and metadata_parser.model_exists_by_name(
-            search_filters.get("comp_type_eq")
-        ):
-            component_model = metadata_parser.get_model_by_name(
-                search_filters.get("comp_type_eq")
-            )
-        else:
-            # Generic component search
-            component_model = ComponentModel
+        # An specific component type may have been provided. Fallback to a
+        # generic component search if not given or not a known component type
+        component_model = COMPONENT_MODELS_BY_IDENTITY.get(
+            search_filters.get("comp_type_eq"), ComponentModel
+        )
         query_build = query_build.join(InventoryItemModel.component)
         filters = filters + __parse_filter_for_sqlalquemy_model(
             component_model, "comp", search_filters
         )
 
     if load_component:
-        # joinedload instead of selectin to avoid performance issues
-        query_build = query_build.options(joinedload(InventoryItemModel.component))
+        # selectinload instead of joinedload. Joining the components, with all
+        # their type tables, into the page query makes the database join them
+        # for every matching item to compute the total count, not only for
+        # the items of the page
+        query_build = query_build.options(selectinload(InventoryItemModel.component))
 
     # todo: apply the same search strategy to other services
     query_build = query_build.filter(*filters).order_by(InventoryItemModel.id.desc())
@@ -65,7 +65,7 @@ from edaparts.services.exceptions import (
 )
 from edaparts.utils.files import hash_sha256
 from edaparts.utils.helpers import BraceMessage as __l
-from edaparts.utils.sqlalchemy import query_page
+from edaparts.utils.sqlalchemy import query_page, query_keyset_page
 
 __logger = logging.getLogger(__name__)
 
@@ -910,21 +910,27 @@ async def get_storable_model_data_path(
 
 
 async def get_storable_objects(
-    db: AsyncSession, storable_type: StorableLibraryResourceType, page_number, page_size
+    db: AsyncSession,
+    storable_type: StorableLibraryResourceType,
+    page_number,
+    page_size,
+    cursor: int | None = None,
 ) -> typing.Tuple[list[FootprintReference | LibraryReference], int]:
     __logger.debug(
         __l(
-            "Querying all storable objects [storable_type={0}, page_number={1}, page_size={2}]",
+            "Querying all storable objects [storable_type={0}, page_number={1}, page_size={2}, cursor={3}]",
             storable_type.value,
             page_number,
             page_size,
+            cursor,
         )
     )
     query_model_type = __get_model_for_storable_type(storable_type)
-    return await query_page(
-        db,
+    query = (
         select(query_model_type)
         .limit(page_size)
-        .offset((page_number - 1) * page_size)
-        .order_by(query_model_type.id.desc()),
+        .order_by(query_model_type.id.desc())
     )
+    if cursor is not None:
+        return await query_keyset_page(db, query, query_model_type.id, cursor)
+    return await query_page(db, query.offset((page_number - 1) * page_size))
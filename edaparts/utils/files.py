@@ -31,19 +31,30 @@ import tempfile
 import uuid
 from typing import BinaryIO
 
+import anyio
+
 
 class TempCopiedFile:
 
     def __init__(self, binary_io: BinaryIO):
         temp_dir = tempfile.gettempdir()
         self.path = pathlib.Path(os.path.join(temp_dir, uuid.uuid4().hex))
+        self.__binary_io = binary_io
+
+    def __copy(self):
         with open(self.path, "wb") as f_dest:
-            shutil.copyfileobj(binary_io, f_dest)
+            shutil.copyfileobj(self.__binary_io, f_dest)
 
-    def __enter__(self):
+    async def __aenter__(self):
+        # Copied in a worker thread, big files would block the event loop
+        try:
+            await anyio.to_thread.run_sync(self.__copy)
+        except BaseException:
+            self.path.unlink(missing_ok=True)
+            raise
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             self.path.unlink(missing_ok=True)
 
@@ -41,19 +41,19 @@ __logger = logging.getLogger(__name__)
 __UNICODE_HINT = "UNICODE=EXISTS"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FootprintModel:
     name: str
     description: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolModel:
     name: str
     description: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Library:
     cad_type: CadType
     models: dict[str, FootprintModel | SymbolModel]
@@ -0,0 +1,76 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+import pathlib
+import typing
+import urllib.parse
+
+import pydantic_core
+from fastapi import Response
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+
+from edaparts.app.config import Config
+
+# Stored models are served as opaque files. Their extensions have no known
+# mimetype and would be sent as text/plain
+MODEL_FILE_MEDIA_TYPE = "application/octet-stream"
+
+
+class PydanticJSONResponse(Response):
+    """
+    JSON response for DTOs built and validated by the handler itself.
+
+    The DTO, or a list of them, is dumped straight to JSON by the pydantic
+    core serializer, skipping the response model validation and the
+    intermediate dict that FastAPI would encode again with json.dumps.
+    Declare the DTO type as the route response_model to keep it in the
+    OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | typing.Sequence[BaseModel]) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def model_file_response(path: pathlib.Path) -> Response:
+    """
+    Response with the content of a stored model file.
+
+    If a reverse proxy internal location is configured, the proxy is told
+    to serve the file itself, so its bytes never go through the application.
+    """
+    if not Config.MODELS_ACCEL_REDIRECT_PREFIX:
+        return FileResponse(path=path, media_type=MODEL_FILE_MEDIA_TYPE)
+
+    relative_path = path.relative_to(Config.MODELS_BASE_DIR).as_posix()
+    return Response(
+        headers={
+            "X-Accel-Redirect": "{0}/{1}".format(
+                Config.MODELS_ACCEL_REDIRECT_PREFIX.rstrip("/"),
+                urllib.parse.quote(relative_path),
+            )
+        }
+    )
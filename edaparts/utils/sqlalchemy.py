@@ -1,9 +1,41 @@
+import time
 import typing
-from sqlalchemy import func, Select
+from sqlalchemy import func, select, Select, FromClause
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def query_page(db: AsyncSession, query: Select) -> typing.Tuple[typing.Any, int]:
+class CountCache:
+    """
+    Keeps the total row count of a listing for a short time, so consecutive
+    pages don't count the whole table again. The cache is per process, writes
+    done by other workers are only seen once the value expires.
+    """
+
+    def __init__(self, ttl: float):
+        self.__ttl = ttl
+        self.__value: int | None = None
+        self.__expires_at = 0.0
+
+    def get(self) -> int | None:
+        if self.__value is not None and time.monotonic() < self.__expires_at:
+            return self.__value
+        return None
+
+    def set(self, value: int):
+        self.__value = value
+        self.__expires_at = time.monotonic() + self.__ttl
+
+    def invalidate(self):
+        self.__value = None
+
+
+async def query_page(
+    db: AsyncSession, query: Select, count_cache: CountCache | None = None
+) -> typing.Tuple[typing.Any, int]:
+    cached_total = count_cache.get() if count_cache else None
+    if cached_total is not None:
+        return (await db.scalars(query)).all(), cached_total
+
     new_query = query.add_columns(
         func.count().over().label("__private_edaparts_search_row_count")
     )
@@ -15,4 +47,45 @@ async def query_page(db: AsyncSession, query: Select) -> typing.Tuple[typing.Any
         if index == 0:
             total = typing.cast(int, row_data[1])
         results.append(row_data[0])
+    if not rows_result:
+        # The window count has no row to ride on when the requested page is
+        # past the end of the results. Count them apart, only in that case
+        total = (
+            await db.scalar(
+                select(func.count()).select_from(
+                    query.limit(None).offset(None).order_by(None).subquery()
+                )
+            )
+        ) or 0
+    if count_cache:
+        count_cache.set(total)
+    return results, total
+
+
+async def query_keyset_page(
+    db: AsyncSession,
+    query: Select,
+    key_column,
+    cursor: int,
+    count_cache: CountCache | None = None,
+    count_from: FromClause | None = None,
+) -> typing.Tuple[typing.Any, int]:
+    """
+    Page of the given query that starts right after the cursor.
+
+    The query is expected to be ordered by descending key, so there is no
+    offset to skip rows through. The total is taken from the count cache, the
+    same one the listing passes to query_page. The full count only runs when
+    the cache is empty or expired, or when no cache is given. It counts the
+    rows of count_from when given, like a base table that avoids the joins of
+    the query, or the rows of the query itself otherwise.
+    """
+    results = (await db.scalars(query.where(key_column < cursor))).all()
+    total = count_cache.get() if count_cache else None
+    if total is None:
+        if count_from is None:
+            count_from = query.limit(None).offset(None).order_by(None).subquery()
+        total = (await db.scalar(select(func.count()).select_from(count_from))) or 0
+        if count_cache:
+            count_cache.set(total)
     return results, total
@@ -0,0 +1,82 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+
+from edaparts.app.api import ApiGZipMiddleware
+
+
+def __get_app(body: bytes):
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/octet-stream"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+async def __get_response_headers(path: str) -> dict[bytes, bytes]:
+    middleware = ApiGZipMiddleware(
+        __get_app(b"x" * 4096), minimum_size=1024, compresslevel=5
+    )
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return dict(messages[0]["headers"])
+
+
+@pytest.mark.anyio
+async def test_gzip_compresses_responses():
+    headers = await __get_response_headers("/components")
+    assert headers[b"content-encoding"] == b"gzip"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/footprints/1/data", "/symbols/1/data"])
+async def test_gzip_skips_model_downloads(path):
+    headers = await __get_response_headers(path)
+    assert b"content-encoding" not in headers
+    assert headers[b"content-length"] == b"4096"
@@ -0,0 +1,69 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+
+from edaparts.models.components.resistor_model import ResistorModel
+from edaparts.services import component_service, inventory_service
+from edaparts.services.exceptions import ResourceAlreadyExistsApiError
+
+
+def __get_dummy_resistor(mpn):
+    return ResistorModel(
+        mpn=mpn,
+        manufacturer="Yageo",
+        value="10k",
+        package="0603 (1608 Metric)",
+        description="RES SMD 10K OHM 1% 1/10W 0603",
+        comment_altium="=Value",
+    )
+
+
+@pytest.mark.anyio
+async def test_create_components_batch_distinct_dicis(fake_session, monkeypatch):
+    # The generator repeats itself, the second item must skip the identifier
+    # already given to the first one even if the DB doesn't have it yet
+    generated = iter(["AAAAAAAAAA", "AAAAAAAAAA", "BBBBBBBBBB"])
+    monkeypatch.setattr(inventory_service, "__id_generator", lambda *_: next(generated))
+    models = [__get_dummy_resistor("RC0603FR-0710KL"), __get_dummy_resistor("RC0603")]
+
+    created = await component_service.create_components(fake_session, models)
+
+    assert created == models
+    assert fake_session.committed
+    items = [obj for obj in fake_session.added if obj not in models]
+    assert len(items) == 2
+    assert [item.component for item in items] == models
+    assert len({item.dici for item in items}) == 2
+
+
+@pytest.mark.anyio
+async def test_create_components_batch_repeated_component(fake_session):
+    models = [__get_dummy_resistor("RC0603FR-0710KL") for _ in range(2)]
+
+    with pytest.raises(ResourceAlreadyExistsApiError):
+        await component_service.create_components(fake_session, models)
+    assert not fake_session.added
+    assert not fake_session.committed
@@ -0,0 +1,71 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from edaparts.services import component_service
+from edaparts.services.exceptions import (
+    ResourceAlreadyExistsApiError,
+    ResourceNotFoundApiError,
+)
+
+
+def __get_integrity_error():
+    return IntegrityError("INSERT", {}, Exception("foreign key violation"))
+
+
+@pytest.mark.anyio
+async def test_create_symbol_relation(fake_session):
+    fake_session.rows = [(2,), (3,)]
+
+    symbol_ids = await component_service.create_symbol_relation(fake_session, 1, [3, 2])
+
+    assert symbol_ids == [2, 3]
+    assert fake_session.committed
+
+
+@pytest.mark.anyio
+async def test_create_symbol_relation_missing_symbol(fake_session):
+    # The lookups after the failed insert find the component and symbol 1
+    fake_session.scalars_error = __get_integrity_error()
+    fake_session.rows = [(1,)]
+
+    with pytest.raises(ResourceNotFoundApiError) as exc_info:
+        await component_service.create_symbol_relation(fake_session, 1, [1, 2])
+    assert exc_info.value.missing_id == 2
+    assert fake_session.rolled_back
+
+
+@pytest.mark.anyio
+async def test_create_symbol_relation_concurrent_change(fake_session):
+    # The lookups after the failed insert find the component and every symbol
+    fake_session.scalars_error = __get_integrity_error()
+    fake_session.rows = [(1,), (2,)]
+
+    with pytest.raises(ResourceAlreadyExistsApiError) as exc_info:
+        await component_service.create_symbol_relation(fake_session, 1, [1, 2])
+    assert exc_info.value.conflicting_id == 1
+    assert fake_session.rolled_back
@@ -0,0 +1,110 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import contextlib
+
+import pytest
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.__rows = rows
+
+    def first(self):
+        return self.__rows[0] if self.__rows else None
+
+    def all(self):
+        return self.__rows
+
+    def fetchall(self):
+        return self.__rows
+
+
+class FakeSession:
+    """
+    Stand-in for an AsyncSession that needs no DB. Every statement is answered
+    with the configured rows and total, and each statement is recorded along
+    with the kind of call that ran it.
+    Added objects are kept, and get their ids on flush. An error set in
+    scalars_error is raised by the next scalars call.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.total = None
+        self.calls = []
+        self.statements = []
+        self.scalars_error = None
+        self.added = []
+        self.committed = False
+        self.rolled_back = False
+
+    async def scalars(self, statement):
+        self.calls.append("scalars")
+        self.statements.append(statement)
+        if self.scalars_error:
+            error, self.scalars_error = self.scalars_error, None
+            raise error
+        return FakeResult([row[0] for row in self.rows])
+
+    async def execute(self, statement):
+        self.calls.append("execute")
+        self.statements.append(statement)
+        return FakeResult(self.rows)
+
+    async def scalar(self, statement):
+        self.calls.append("scalar")
+        self.statements.append(statement)
+        return self.total
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def add_all(self, objs):
+        self.added.extend(objs)
+
+    async def flush(self):
+        for index, obj in enumerate(self.added, start=1):
+            obj.id = index
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    @property
+    def no_autoflush(self):
+        return contextlib.nullcontext()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_session():
+    return FakeSession()
@@ -0,0 +1,146 @@
+#
+# MIT License
+#
+# Copyright (c) 2024 Pablo Rodriguez Nava, @pablintino
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+
+
+import pytest
+from sqlalchemy import select
+
+from edaparts.models.inventory.inventory_category_model import InventoryCategoryModel
+from edaparts.utils import sqlalchemy as sqlalchemy_utils
+from edaparts.utils.sqlalchemy import CountCache, query_page, query_keyset_page
+
+
+def __get_query():
+    return select(InventoryCategoryModel).limit(10).offset(0)
+
+
+def test_count_cache_empty():
+    assert CountCache(ttl=30).get() is None
+
+
+def test_count_cache_set_get():
+    count_cache = CountCache(ttl=30)
+    count_cache.set(0)
+    assert count_cache.get() == 0
+    count_cache.set(42)
+    assert count_cache.get() == 42
+
+
+def test_count_cache_expiry(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(sqlalchemy_utils.time, "monotonic", lambda: now)
+    count_cache = CountCache(ttl=30)
+    count_cache.set(42)
+
+    now += 29
+    assert count_cache.get() == 42
+    now += 1
+    assert count_cache.get() is None
+
+
+def test_count_cache_invalidate():
+    count_cache = CountCache(ttl=30)
+    count_cache.set(42)
+    count_cache.invalidate()
+    assert count_cache.get() is None
+
+
+@pytest.mark.anyio
+async def test_query_page_window_count(fake_session):
+    count_cache = CountCache(ttl=30)
+    fake_session.rows = [("a", 3), ("b", 3)]
+
+    results, total = await query_page(fake_session, __get_query(), count_cache)
+
+    assert results == ["a", "b"]
+    assert total == 3
+    assert fake_session.calls == ["execute"]
+    assert count_cache.get() == 3
+
+
+@pytest.mark.anyio
+async def test_query_page_cached_total(fake_session):
+    count_cache = CountCache(ttl=30)
+    count_cache.set(3)
+    fake_session.rows = [("a",)]
+
+    results, total = await query_page(fake_session, __get_query(), count_cache)
+
+    assert results == ["a"]
+    assert total == 3
+    assert fake_session.calls == ["scalars"]
+
+
+@pytest.mark.anyio
+async def test_query_page_past_the_end(fake_session):
+    # No row carries the window count, the total is counted apart
+    count_cache = CountCache(ttl=30)
+    fake_session.total = 3
+
+    results, total = await query_page(fake_session, __get_query(), count_cache)
+
+    assert results == []
+    assert total == 3
+    assert fake_session.calls == ["execute", "scalar"]
+    assert count_cache.get() == 3
+
+
+@pytest.mark.anyio
+async def test_query_keyset_page_count_from(fake_session):
+    count_cache = CountCache(ttl=30)
+    fake_session.rows = [("a",)]
+    fake_session.total = 3
+    query = __get_query().order_by(InventoryCategoryModel.id.desc())
+
+    results, total = await query_keyset_page(
+        fake_session,
+        query,
+        InventoryCategoryModel.id,
+        10,
+        count_cache=count_cache,
+        count_from=InventoryCategoryModel.__table__,
+    )
+
+    assert results == ["a"]
+    assert total == 3
+    assert fake_session.calls == ["scalars", "scalar"]
+    count_statement = fake_session.statements[1]
+    assert count_statement.get_final_froms() == [InventoryCategoryModel.__table__]
+    assert count_cache.get() == 3
+
+
+@pytest.mark.anyio
+async def test_query_keyset_page_cached_total(fake_session):
+    count_cache = CountCache(ttl=30)
+    count_cache.set(3)
+    fake_session.rows = [("a",)]
+    query = __get_query().order_by(InventoryCategoryModel.id.desc())
+
+    results, total = await query_keyset_page(
+        fake_session, query, InventoryCategoryModel.id, 10, count_cache=count_cache
+    )
+
+    assert results == ["a"]
+    assert total == 3
+    assert fake_session.calls == ["scalars"]